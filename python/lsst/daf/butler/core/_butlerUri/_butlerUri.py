@@ -22,11 +22,13 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import importlib
 import urllib.parse
 import posixpath
-import copy
 import logging
 import re
+import sys
 
 from pathlib import Path, PurePath, PurePosixPath
 
@@ -35,6 +37,7 @@ __all__ = ('ButlerURI',)
 from typing import (
     TYPE_CHECKING,
     Any,
+    Dict,
     Iterable,
     Iterator,
     List,
@@ -44,6 +47,7 @@ from typing import (
     Union,
 )
 
+from ..utils import cached_getter
 from .utils import NoTransaction
 
 if TYPE_CHECKING:
@@ -58,6 +62,47 @@ ESCAPES_RE = re.compile(r"%[A-F0-9]{2}")
 # Precomputed escaped hash
 ESCAPED_HASH = urllib.parse.quote("#")
 
+# Module and class name of the ButlerURI subclass for each supported
+# scheme.  Subclasses are imported on first use since some of them
+# depend on optional packages.  Any scheme starting with "http" uses the
+# "http" entry.
+_SCHEME_SUBCLASS_NAMES: Dict[str, Tuple[str, str]] = {
+    "": (".schemeless", "ButlerSchemelessURI"),
+    "file": (".file", "ButlerFileURI"),
+    "s3": (".s3", "ButlerS3URI"),
+    "http": (".http", "ButlerHttpURI"),
+    # Rules for scheme names disallow pkg_resource
+    "resource": (".packageresource", "ButlerPackageResourceURI"),
+    # in-memory datastore object
+    "mem": (".mem", "ButlerInMemoryURI"),
+}
+
+# Subclasses already imported, keyed by scheme.
+_schemeSubclasses: Dict[str, Type[ButlerURI]] = {}
+
+
+@functools.lru_cache(maxsize=2048)
+def _urlparse(uri: str) -> urllib.parse.ParseResult:
+    """Parse a URI string, caching the result.
+
+    The same strings (datastore roots, config search paths) are parsed
+    many times so it is worth remembering the answer.  This is safe because
+    `urllib.parse.ParseResult` is immutable.
+
+    Parameters
+    ----------
+    uri : `str`
+        URI to parse.
+
+    Returns
+    -------
+    parsed : `urllib.parse.ParseResult`
+        The parsed URI.  The scheme is interned since it is compared and
+        used as a lookup key for every new URI.
+    """
+    parsed = urllib.parse.urlparse(uri)
+    return parsed._replace(scheme=sys.intern(parsed.scheme))
+
 
 class ButlerURI:
     """Convenience wrapper around URI parsers.
@@ -88,6 +133,9 @@ class ButlerURI:
         If `True` indicates that this URI points to a temporary resource.
     """
 
+    __slots__ = ("_uri", "dirLike", "isTemporary", "_cached_geturl", "_cached_relativeToPathRoot",
+                 "_cached_getExtension", "__weakref__")
+
     _pathLib: Type[PurePath] = PurePosixPath
     """Path library to use for this scheme."""
 
@@ -131,6 +179,11 @@ class ButlerURI:
                 root: Optional[Union[str, ButlerURI]] = None, forceAbsolute: bool = True,
                 forceDirectory: bool = False, isTemporary: bool = False) -> ButlerURI:
         """Create and return new specialist ButlerURI subclass."""
+        if isinstance(uri, ButlerURI):
+            # Since ButlerURI is immutable we can return the argument
+            # unchanged.
+            return uri
+
         parsed: urllib.parse.ParseResult
         dirLike: bool = False
         subclass: Optional[Type[ButlerURI]] = None
@@ -159,9 +212,14 @@ class ButlerURI:
                         # Do replacement after this /
                         uri = uri[:dirpos+1] + uri[dirpos+1:].replace(ESCAPED_HASH, "#")
 
-            parsed = urllib.parse.urlparse(uri)
+            parsed = _urlparse(uri)
+            if parsed.scheme and parsed.scheme != "file":
+                # Resolving a remote URI does not depend on the current
+                # directory or the local file system so the result can be
+                # shared between instances.
+                subclass, parsed, dirLike = _resolveRemoteUri(parsed, forceDirectory)
         elif isinstance(uri, urllib.parse.ParseResult):
-            parsed = copy.copy(uri)
+            parsed = uri
             # If we are being instantiated with a subclass, rather than
             # ButlerURI, ensure that that subclass is used directly.
             # This could lead to inconsistencies if this constructor
@@ -175,40 +233,12 @@ class ButlerURI:
                 parsed, dirLike = cls._fixDirectorySep(parsed, forceDirectory)
                 subclass = cls
 
-        elif isinstance(uri, ButlerURI):
-            # Since ButlerURI is immutable we can return the argument
-            # unchanged.
-            return uri
         else:
             raise ValueError("Supplied URI must be string, Path, "
                              f"ButlerURI, or ParseResult but got '{uri!r}'")
 
         if subclass is None:
-            # Work out the subclass from the URI scheme
-            if not parsed.scheme:
-                from .schemeless import ButlerSchemelessURI
-                subclass = ButlerSchemelessURI
-            elif parsed.scheme == "file":
-                from .file import ButlerFileURI
-                subclass = ButlerFileURI
-            elif parsed.scheme == "s3":
-                from .s3 import ButlerS3URI
-                subclass = ButlerS3URI
-            elif parsed.scheme.startswith("http"):
-                from .http import ButlerHttpURI
-                subclass = ButlerHttpURI
-            elif parsed.scheme == "resource":
-                # Rules for scheme names disallow pkg_resource
-                from .packageresource import ButlerPackageResourceURI
-                subclass = ButlerPackageResourceURI
-            elif parsed.scheme == "mem":
-                # in-memory datastore object
-                from .mem import ButlerInMemoryURI
-                subclass = ButlerInMemoryURI
-            else:
-                raise NotImplementedError(f"No URI support for scheme: '{parsed.scheme}'"
-                                          " in {parsed.geturl()}")
-
+            subclass = cls._getSubclassForScheme(parsed)
             parsed, dirLike = subclass._fixupPathUri(parsed, root=root,
                                                      forceAbsolute=forceAbsolute,
                                                      forceDirectory=forceDirectory)
@@ -216,8 +246,7 @@ class ButlerURI:
             # It is possible for the class to change from schemeless
             # to file so handle that
             if parsed.scheme == "file":
-                from .file import ButlerFileURI
-                subclass = ButlerFileURI
+                subclass = cls._getSubclassForScheme(parsed)
 
         # Now create an instance of the correct subclass and set the
         # attributes directly
@@ -227,6 +256,37 @@ class ButlerURI:
         self.isTemporary = isTemporary
         return self
 
+    @staticmethod
+    def _getSubclassForScheme(parsed: urllib.parse.ParseResult) -> Type[ButlerURI]:
+        """Return the ButlerURI subclass that handles a URI scheme.
+
+        Parameters
+        ----------
+        parsed : `urllib.parse.ParseResult`
+            The parsed URI.
+
+        Returns
+        -------
+        subclass : `type`
+            Subclass of `ButlerURI` to use for this URI.
+
+        Raises
+        ------
+        NotImplementedError
+            Raised if the scheme is not supported.
+        """
+        scheme = parsed.scheme
+        subclass = _schemeSubclasses.get(scheme)
+        if subclass is None:
+            key = "http" if scheme.startswith("http") else scheme
+            if key not in _SCHEME_SUBCLASS_NAMES:
+                raise NotImplementedError(f"No URI support for scheme: '{scheme}'"
+                                          f" in {parsed.geturl()}")
+            moduleName, className = _SCHEME_SUBCLASS_NAMES[key]
+            subclass = getattr(importlib.import_module(moduleName, __package__), className)
+            _schemeSubclasses[scheme] = subclass
+        return subclass
+
     @property
     def scheme(self) -> str:
         """Return the URI scheme.
@@ -258,6 +318,7 @@ class ButlerURI:
         raise AttributeError(f"Non-file URI ({self}) has no local OS path.")
 
     @property
+    @cached_getter
     def relativeToPathRoot(self) -> str:
         """Return path relative to network location.
 
@@ -266,8 +327,14 @@ class ButlerURI:
 
         Always unquotes.
         """
-        p = self._pathLib(self.path)
-        relToRoot = str(p.relative_to(p.root))
+        path = self.path
+        if self._pathModule is posixpath and not (path.startswith("./") or path.endswith("/.")
+                                                  or "//" in path or "/./" in path):
+            # Nothing for pathlib to normalize so strip the root directly
+            relToRoot = path.strip("/") or "."
+        else:
+            p = self._pathLib(path)
+            relToRoot = str(p.relative_to(p.root))
         if self.dirLike and not relToRoot.endswith("/"):
             relToRoot += "/"
         return urllib.parse.unquote(relToRoot)
@@ -298,6 +365,7 @@ class ButlerURI:
         """Return any query strings included in the URI."""
         return self._uri.query
 
+    @cached_getter
     def geturl(self) -> str:
         """Return the URI in string form.
 
@@ -354,7 +422,8 @@ class ButlerURI:
 
         Equivalent of `os.path.basename()``.
         """
-        return self.split()[1]
+        # Equivalent to split() without constructing the head URI
+        return urllib.parse.unquote(self._pathModule.split(self.path)[1])
 
     def dirname(self) -> ButlerURI:
         """Return the directory component of the path as a new `ButlerURI`.
@@ -485,6 +554,7 @@ class ButlerURI:
 
         return self.replace(path=path + ext)
 
+    @cached_getter
     def getExtension(self) -> str:
         """Return the file extension(s) associated with this URI path.
 
@@ -502,16 +572,21 @@ class ButlerURI:
         # Get the file part of the path so as not to be confused by
         # "." in directory names.
         basename = self.basename()
-        extensions = self._pathLib(basename).suffixes
+
+        # Same rules as PurePath.suffixes: leading dots do not start an
+        # extension and a trailing dot means there is no extension.
+        if basename.endswith("."):
+            return ""
+        extensions = basename.lstrip(".").split(".")[1:]
 
         if not extensions:
             return ""
 
-        ext = extensions.pop()
+        ext = "." + extensions.pop()
 
         # Multiple extensions, decide whether to include the final two
         if extensions and ext in special:
-            ext = f"{extensions[-1]}{ext}"
+            ext = f".{extensions[-1]}{ext}"
 
         return ext
 
@@ -748,7 +823,7 @@ class ButlerURI:
 
     def __hash__(self) -> int:
         """Return hash of this object."""
-        return hash(str(self))
+        return hash(self.geturl())
 
     def __copy__(self) -> ButlerURI:
         """Copy constructor.
@@ -976,3 +1051,29 @@ class ButlerURI:
         # Finally, return any explicitly given files in one group
         if grouped and singles:
             yield iter(singles)
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolveRemoteUri(parsed: urllib.parse.ParseResult,
+                      forceDirectory: bool) -> Tuple[Type[ButlerURI], urllib.parse.ParseResult, bool]:
+    """Work out the class and components of a URI with a remote scheme.
+
+    Parameters
+    ----------
+    parsed : `urllib.parse.ParseResult`
+        The parsed URI.  Must have a scheme other than ``file``.
+    forceDirectory : `bool`
+        If `True` forces the URI to end with a separator.
+
+    Returns
+    -------
+    subclass : `type`
+        Subclass of `ButlerURI` to use for this URI.
+    parsed : `urllib.parse.ParseResult`
+        The fixed up URI components.
+    dirLike : `bool`
+        Whether the URI refers to a directory.
+    """
+    subclass = ButlerURI._getSubclassForScheme(parsed)
+    parsed, dirLike = subclass._fixupPathUri(parsed, forceDirectory=forceDirectory)
+    return subclass, parsed, dirLike
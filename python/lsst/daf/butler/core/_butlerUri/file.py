@@ -26,7 +26,6 @@ import os.path
 import shutil
 import urllib.parse
 import posixpath
-import copy
 import logging
 import re
 
@@ -42,7 +41,7 @@ from typing import (
     Union,
 )
 
-from ..utils import safeMakeDir
+from ..utils import cached_getter, safeMakeDir
 from .utils import NoTransaction, os2posix, posix2os
 from ._butlerUri import ButlerURI
 
@@ -57,6 +56,8 @@ log = logging.getLogger(__name__)
 class ButlerFileURI(ButlerURI):
     """URI for explicit ``file`` scheme."""
 
+    __slots__ = ("_cached_ospath",)
+
     transferModes = ("copy", "link", "symlink", "hardlink", "relsymlink", "auto", "move")
     transferDefault: str = "link"
 
@@ -64,6 +65,7 @@ class ButlerFileURI(ButlerURI):
     isLocal = True
 
     @property
+    @cached_getter
     def ospath(self) -> str:
         """Path component of the URI localized to current OS.
 
@@ -400,23 +402,24 @@ class ButlerFileURI(ButlerURI):
         # home directories since "file" scheme is explicitly documented
         # to not do tilde expansion.
         sep = posixpath.sep
+        path = parsed.path
 
         # For local file system we can explicitly check to see if this
         # really is a directory. The URI might point to a location that
         # does not exists yet but all that matters is if it is a directory
         # then we make sure use that fact. No need to do the check if
         # we are already being told.
-        if not forceDirectory and posixpath.isdir(parsed.path):
+        if not forceDirectory and posixpath.isdir(path):
             forceDirectory = True
 
         # For an absolute path all we need to do is check if we need
         # to force the directory separator
-        if posixpath.isabs(parsed.path):
+        if posixpath.isabs(path):
             if forceDirectory:
-                if not parsed.path.endswith(sep):
-                    parsed = parsed._replace(path=parsed.path+sep)
+                if not path.endswith(sep):
+                    parsed = parsed._replace(path=path+sep)
                 dirLike = True
-            return copy.copy(parsed), dirLike
+            return parsed, dirLike
 
         # Relative path so must fix it to be compliant with the standard
 
@@ -430,11 +433,11 @@ class ButlerFileURI(ButlerURI):
                 raise RuntimeError(f"The override root must be a file URI not {root.scheme}")
             root = os.path.abspath(root.ospath)
 
-        replacements["path"] = posixpath.normpath(posixpath.join(os2posix(root), parsed.path))
+        replacements["path"] = posixpath.normpath(posixpath.join(os2posix(root), path))
 
         # normpath strips trailing "/" so put it back if necessary
         # Acknowledge that trailing separator exists.
-        if forceDirectory or (parsed.path.endswith(sep) and not replacements["path"].endswith(sep)):
+        if forceDirectory or (path.endswith(sep) and not replacements["path"].endswith(sep)):
             replacements["path"] += sep
             dirLike = True
 
@@ -334,6 +334,8 @@ def _getFileURL(path: Union[Location, ButlerURI, str]) -> str:
 class ButlerHttpURI(ButlerURI):
     """General HTTP(S) resource."""
 
+    __slots__ = ()
+
     _session = requests.Session()
     _sessionInitialized = False
 
@@ -33,6 +33,8 @@ class ButlerInMemoryURI(ButlerURI):
     is in memory.
     """
 
+    __slots__ = ()
+
     def exists(self) -> bool:
         """Test for existence and always return False."""
         return True
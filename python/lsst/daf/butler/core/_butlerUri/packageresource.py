@@ -37,6 +37,8 @@ class ButlerPackageResourceURI(ButlerURI):
     resource name.
     """
 
+    __slots__ = ()
+
     def exists(self) -> bool:
         """Check that the python resource exists."""
         return pkg_resources.resource_exists(self.netloc, self.relativeToPathRoot)
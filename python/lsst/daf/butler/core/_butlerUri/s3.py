@@ -93,6 +93,8 @@ log = logging.getLogger(__name__)
 class ButlerS3URI(ButlerURI):
     """S3 URI implementation class."""
 
+    __slots__ = ()
+
     @property
     def client(self) -> boto3.client:
         """Client object to address remote resource."""
@@ -26,6 +26,7 @@ import os
 import urllib.parse
 import os.path
 import logging
+import re
 
 __all__ = ('ButlerSchemelessURI',)
 
@@ -38,15 +39,21 @@ from typing import (
 )
 
 from .file import ButlerFileURI
-from .utils import os2posix
+from .utils import IS_POSIX, os2posix
 from ._butlerUri import ButlerURI
 
 log = logging.getLogger(__name__)
 
+# Absolute POSIX paths that are unchanged by user and environment variable
+# expansion, normalization and quoting.
+_CLEAN_ABSOLUTE_PATH_RE = re.compile(r"(?!.*(//|/\.\.?(/|\Z)))/[A-Za-z0-9_.\-/]*\Z")
+
 
 class ButlerSchemelessURI(ButlerFileURI):
     """Scheme-less URI referring to the local file system."""
 
+    __slots__ = ()
+
     _pathLib = PurePath
     _pathModule = os.path
     quotePaths = False
@@ -131,15 +138,32 @@ class ButlerSchemelessURI(ButlerFileURI):
         Scheme-less paths are normalized and environment variables are
         expanded.
         """
+        # We do allow fragment but do not expect params or query to be
+        # specified for schemeless
+        if parsed.params or parsed.query:
+            log.warning("Additional items unexpectedly encountered in schemeless URI: %s", parsed.geturl())
+
+        # Fast path for the common case of an absolute path that needs
+        # no expansion, normalization or quoting.
+        if IS_POSIX and _CLEAN_ABSOLUTE_PATH_RE.match(parsed.path):
+            path = parsed.path
+            dirLike = forceDirectory or path.endswith("/") or os.path.isdir(path)
+            if dirLike and not path.endswith("/"):
+                path += "/"
+            return parsed._replace(scheme="file", path=path), dirLike
+
         # assume we are not dealing with a directory URI
         dirLike = False
 
-        # Replacement values for the URI
-        replacements = {}
+        # Scheme of the fixed up URI, becomes "file" for absolute paths
+        scheme = parsed.scheme
+
+        # this is a local OS file path
+        sep = os.sep
 
-        if root is None:
-            root = os.path.abspath(os.path.curdir)
-        elif isinstance(root, ButlerURI):
+        # The root is only needed for relative paths so do not look up
+        # the current directory until then.
+        if isinstance(root, ButlerURI):
             if root.scheme and root.scheme != "file":
                 raise RuntimeError(f"The override root must be a file URI not {root.scheme}")
             root = os.path.abspath(root.ospath)
@@ -154,17 +178,19 @@ class ButlerSchemelessURI(ButlerFileURI):
 
         # Ensure that this becomes a file URI if it is already absolute
         if os.path.isabs(expandedPath):
-            replacements["scheme"] = "file"
+            scheme = "file"
             # Keep in OS form for now to simplify later logic
-            replacements["path"] = os.path.normpath(expandedPath)
+            path = os.path.normpath(expandedPath)
         elif forceAbsolute:
             # This can stay in OS path form, do not change to file
             # scheme.
-            replacements["path"] = os.path.normpath(os.path.join(root, expandedPath))
+            if root is None:
+                root = os.path.abspath(os.path.curdir)
+            path = os.path.normpath(os.path.join(root, expandedPath))
         else:
             # No change needed for relative local path staying relative
             # except normalization
-            replacements["path"] = os.path.normpath(expandedPath)
+            path = os.path.normpath(expandedPath)
             # normalization of empty path returns "." so we are dirLike
             if expandedPath == "":
                 dirLike = True
@@ -177,29 +203,23 @@ class ButlerSchemelessURI(ButlerFileURI):
         # does not exists yet but all that matters is if it is a directory
         # then we make sure use that fact. No need to do the check if
         # we are already being told.
-        if not forceDirectory and os.path.isdir(replacements["path"]):
+        if not forceDirectory and os.path.isdir(path):
             forceDirectory = True
 
         # add the trailing separator only if explicitly required or
         # if it was stripped by normpath. Acknowledge that trailing
         # separator exists.
-        endsOnSep = expandedPath.endswith(os.sep) and not replacements["path"].endswith(os.sep)
-        if (forceDirectory or endsOnSep or dirLike):
+        if forceDirectory or dirLike or expandedPath.endswith(sep):
             dirLike = True
-            if not replacements["path"].endswith(os.sep):
-                replacements["path"] += os.sep
+            if not path.endswith(sep):
+                path += sep
 
-        if "scheme" in replacements:
+        if scheme:
             # This is now meant to be a URI path so force to posix
             # and quote
-            replacements["path"] = urllib.parse.quote(os2posix(replacements["path"]))
+            path = urllib.parse.quote(os2posix(path))
 
         # ParseResult is a NamedTuple so _replace is standard API
-        parsed = parsed._replace(**replacements)
-
-        # We do allow fragment but do not expect params or query to be
-        # specified for schemeless
-        if parsed.params or parsed.query:
-            log.warning("Additional items unexpectedly encountered in schemeless URI: %s", parsed.geturl())
+        parsed = parsed._replace(scheme=scheme, path=path)
 
         return parsed, dirLike
@@ -25,6 +25,7 @@ import contextlib
 import posixpath
 import logging
 import os
+import re
 
 from pathlib import Path, PurePath, PurePosixPath
 
@@ -48,6 +49,12 @@ if IS_POSIX:
 else:
     OS_ROOT_PATH = Path().resolve().root
 
+# POSIX-form paths that pathlib would normalize (repeated separators,
+# "." segments, empty paths) or that contain a drive.  Separator
+# conversion is done by pathlib for these and by string replacement
+# otherwise.
+_NEEDS_PATHLIB_RE = re.compile(r"//|(^|/)\.(/|$)|:|^$")
+
 log = logging.getLogger(__name__)
 
 
@@ -67,6 +74,10 @@ def os2posix(ospath: str) -> str:
     if IS_POSIX:
         return ospath
 
+    posix = ospath.replace(os.sep, posixpath.sep)
+    if not _NEEDS_PATHLIB_RE.search(posix) and not ospath.endswith(posixpath.sep):
+        return posix
+
     posix = PurePath(ospath).as_posix()
 
     # PurePath strips trailing "/" from paths such that you can no
@@ -94,6 +105,10 @@ def posix2os(posix: Union[PurePath, str]) -> str:
     if IS_POSIX:
         return str(posix)
 
+    posix = str(posix)
+    if OS_ROOT_PATH == os.sep and not _NEEDS_PATHLIB_RE.search(posix):
+        return posix.replace(posixpath.sep, os.sep)
+
     posixPath = PurePosixPath(posix)
     paths = list(posixPath.parts)
 
@@ -0,0 +1,290 @@
+# This file is part of daf_butler.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (http://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+"""Process-level cache of parsed configuration file content."""
+
+__all__ = ("ConfigContentCache", "ConfigDiskCache")
+
+import copy
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+
+import yaml
+
+from ._butlerUri import ButlerURI
+
+log = logging.getLogger(__name__)
+
+# Stamp describing the state of a file when it was read.
+_Stamp = Tuple[Any, ...]
+
+
+def _getStamp(uri: ButlerURI) -> Optional[_Stamp]:
+    """Return a stamp that changes whenever the given resource changes.
+
+    Parameters
+    ----------
+    uri : `ButlerURI`
+        Resource to examine.
+
+    Returns
+    -------
+    stamp : `tuple` or `None`
+        The stamp, or `None` if there is no cheap way to tell whether the
+        resource has changed (in which case its content must not be cached).
+
+    Notes
+    -----
+    The stamp of a local file includes a digest of its content, since a
+    file rewritten in place at the same size within the resolution of the
+    file system timestamps can not be distinguished by `os.stat` alone.
+    Reading and hashing the file is still much cheaper than parsing it.
+    """
+    if uri.scheme == "file":
+        try:
+            with open(uri.ospath, "rb") as fd:
+                content = fd.read()
+        except OSError:
+            return None
+        return (len(content), hashlib.blake2b(content, digest_size=16).digest())
+    if uri.scheme == "resource":
+        # Package resources do not change during the lifetime of a process.
+        return ()
+    return None
+
+
+class ConfigContentCache:
+    """Cache of the parsed content of configuration files.
+
+    Entries are keyed on the URI of the file and are only reused if neither
+    that file nor any of the files it included have changed since they were
+    read.  Only local files and package resources are cached this way.
+
+    Separately, the parsed form of self-contained files is also cached keyed
+    on a digest of their raw content, so that identical files found at
+    different locations (such as copies of the same defaults in several
+    search path directories) are only parsed once.
+
+    Parameters
+    ----------
+    maxsize : `int`, optional
+        Maximum number of files whose content will be retained.  The least
+        recently used entries are discarded first.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, Tuple[Tuple[Tuple[ButlerURI, _Stamp], ...], Any]] = OrderedDict()
+        self._parsed: OrderedDict[bytes, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, uri: ButlerURI) -> Optional[Any]:
+        """Return the cached content for a configuration file.
+
+        Parameters
+        ----------
+        uri : `ButlerURI`
+            Location of the configuration file.
+
+        Returns
+        -------
+        content : `object` or `None`
+            A private copy of the parsed content that the caller is free to
+            modify, or `None` if there is no valid entry for this file.
+        """
+        key = uri.geturl()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        stamps, content = entry
+        if any(_getStamp(dependency) != stamp for dependency, stamp in stamps):
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        return copy.deepcopy(content)
+
+    def put(self, uri: ButlerURI, content: Any, included: Iterable[ButlerURI] = ()) -> None:
+        """Store the parsed content of a configuration file.
+
+        Parameters
+        ----------
+        uri : `ButlerURI`
+            Location of the configuration file.
+        content : `object`
+            Parsed content of the file.  This is stored without copying, so
+            the caller must not modify it afterwards.
+        included : iterable of `ButlerURI`, optional
+            Other files that were read in order to construct ``content``.
+        """
+        stamps = []
+        for dependency in (uri, *included):
+            stamp = _getStamp(dependency)
+            if stamp is None:
+                return
+            stamps.append((dependency, stamp))
+        entry = (tuple(stamps), content)
+        key = uri.geturl()
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def getParsed(self, content: bytes) -> Optional[Any]:
+        """Return the cached parsed form of some configuration content.
+
+        Parameters
+        ----------
+        content : `bytes`
+            Raw content of a configuration file.
+
+        Returns
+        -------
+        data : `object` or `None`
+            The parsed content, or `None` if identical content has not been
+            parsed before.  This is shared with the cache and must not be
+            modified.
+        """
+        key = hashlib.blake2b(content, digest_size=16).digest()
+        with self._lock:
+            data = self._parsed.get(key)
+            if data is None:
+                return None
+            self._parsed.move_to_end(key)
+        return data
+
+    def putParsed(self, content: bytes, data: Any) -> None:
+        """Store the parsed form of some configuration content.
+
+        Parameters
+        ----------
+        content : `bytes`
+            Raw content of a configuration file.  This must not depend on
+            any other file (via ``!include``).
+        data : `object`
+            The result of parsing ``content``.  This is stored without
+            copying, so the caller must not modify it afterwards.
+        """
+        key = hashlib.blake2b(content, digest_size=16).digest()
+        with self._lock:
+            self._parsed[key] = data
+            self._parsed.move_to_end(key)
+            while len(self._parsed) > self._maxsize:
+                self._parsed.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._parsed.clear()
+
+
+class ConfigDiskCache:
+    """Cache of parsed configuration content that persists between processes.
+
+    Entries are pickles of the parsed content, stored in a directory and
+    keyed on a digest of the raw bytes of the file (along with the version
+    of the YAML parser), so a modified file is never matched to a stale
+    entry.  Content that depends on other files (via ``!include``) must not
+    be stored since its digest does not reflect those files.
+
+    Parameters
+    ----------
+    directory : `str`
+        Directory in which to store the cache entries.  It will be created
+        if it does not exist.
+
+    Notes
+    -----
+    Entries are read with `pickle`, so the directory must only be writable
+    by trusted users.  Any problem reading or writing an entry is logged and
+    otherwise ignored; the caller then falls back to parsing the file.
+    """
+
+    _VERSION = 1
+    """Version of the on-disk format, included in every key."""
+
+    def __init__(self, directory: str):
+        self._directory = directory
+
+    def _getPath(self, content: bytes) -> str:
+        """Return the path of the entry for the given raw content."""
+        digest = hashlib.blake2b(content, digest_size=16)
+        digest.update(f"{self._VERSION}:{yaml.__version__}".encode())
+        return os.path.join(self._directory, f"{digest.hexdigest()}.pickle")
+
+    def get(self, content: bytes) -> Optional[Any]:
+        """Return the cached parsed form of some configuration content.
+
+        Parameters
+        ----------
+        content : `bytes`
+            Raw content of the configuration file.
+
+        Returns
+        -------
+        data : `object` or `None`
+            The parsed content, or `None` if it has not been cached.
+        """
+        path = self._getPath(content)
+        try:
+            with open(path, "rb") as fd:
+                return pickle.load(fd)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.debug("Ignoring unreadable config cache entry %s: %s", path, e)
+            return None
+
+    def put(self, content: bytes, data: Any) -> None:
+        """Store the parsed form of some configuration content.
+
+        Parameters
+        ----------
+        content : `bytes`
+            Raw content of the configuration file.
+        data : `object`
+            The result of parsing ``content``.
+        """
+        path = self._getPath(content)
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            # Write to a temporary file and rename it so that concurrent
+            # readers never see a partially-written entry.
+            with tempfile.NamedTemporaryFile(dir=self._directory, suffix=".tmp", delete=False) as fd:
+                try:
+                    pickle.dump(data, fd, protocol=pickle.HIGHEST_PROTOCOL)
+                except BaseException:
+                    os.unlink(fd.name)
+                    raise
+            os.replace(fd.name, path)
+        except Exception as e:
+            log.debug("Unable to write config cache entry %s: %s", path, e)
@@ -26,7 +26,9 @@ from __future__ import annotations
 __all__ = ("Config", "ConfigSubset")
 
 import collections
+import concurrent.futures
 import copy
+import functools
 import json
 import logging
 import pprint
@@ -40,6 +42,7 @@ from typing import Any, Dict, List, Sequence, Optional, ClassVar, IO, Tuple, Uni
 
 from lsst.utils import doImport
 from ._butlerUri import ButlerURI
+from ._configCache import ConfigContentCache, ConfigDiskCache
 
 yaml.add_representer(collections.defaultdict, Representer.represent_dict)
 
@@ -50,6 +53,10 @@ log = logging.getLogger(__name__)
 # PATH-like environment variable to use for defaults.
 CONFIG_PATH = "DAF_BUTLER_CONFIG_PATH"
 
+# Environment variable naming a directory in which parsed YAML config files
+# can be cached between processes.
+CONFIG_CACHE_DIR = "DAF_BUTLER_CONFIG_CACHE_DIR"
+
 try:
     yamlLoader = yaml.CSafeLoader
 except AttributeError:
@@ -57,6 +64,15 @@ except AttributeError:
     # (but assume for mypy's sake that they're the same)
     yamlLoader = yaml.SafeLoader  # type: ignore
 
+try:
+    yamlDumper = yaml.CSafeDumper
+except AttributeError:
+    # As above, the C emitter may not be available.
+    yamlDumper = yaml.SafeDumper  # type: ignore
+
+# Parsed content of configuration files that have already been read.
+_contentCache = ConfigContentCache()
+
 
 class Loader(yamlLoader):
     """YAML Loader that supports file include directives.
@@ -85,6 +101,8 @@ class Loader(yamlLoader):
         except AttributeError:
             # No choice but to assume a local filesystem
             self._root = ButlerURI("no-file.yaml")
+        # Every file read via !include, including nested includes.
+        self.included: List[ButlerURI] = []
         Loader.add_constructor("!include", Loader.include)
 
     def include(self, node):
@@ -128,7 +146,99 @@ class Loader(yamlLoader):
         # Store the bytes into a BytesIO so we can attach a .name
         stream = io.BytesIO(data)
         stream.name = fileuri.geturl()
-        return yaml.load(stream, Loader)
+        content, included = _loadYaml(stream)
+        self.included.append(fileuri)
+        self.included.extend(included)
+        return content
+
+
+def _loadYaml(stream: Any) -> Tuple[Any, List[ButlerURI]]:
+    """Parse a YAML document, reporting the files it included.
+
+    Parameters
+    ----------
+    stream : `IO` or `str`
+        Stream to pass to the YAML loader.
+
+    Returns
+    -------
+    content : `object`
+        The parsed document.
+    included : `list` of `ButlerURI`
+        Files read via ``!include`` directives to construct ``content``.
+    """
+    loader = Loader(stream)
+    try:
+        return loader.get_single_data(), loader.included
+    finally:
+        loader.dispose()
+
+
+@functools.lru_cache(maxsize=1024)
+def _splitStringKey(key: str) -> Tuple[str, ...]:
+    """Split a delimited string key into its hierarchical components.
+
+    See `Config._splitIntoKeys` for the syntax.  The same keys tend to be
+    used over and over again so the result is cached.
+
+    Parameters
+    ----------
+    key : `str`
+        Key to split.
+
+    Returns
+    -------
+    keys : `tuple` of `str`
+        Hierarchical keys.
+    """
+    if key[0].isalnum():
+        return (key, )
+    d = key[0]
+    key = key[1:]
+    escaped = f"\\{d}"
+    temp = None
+    if escaped in key:
+        # Complain at the attempt to escape the escape
+        doubled = fr"\{escaped}"
+        if doubled in key:
+            raise ValueError(f"Escaping an escaped delimiter ({doubled} in {key})"
+                             " is not yet supported.")
+        # Replace with a character that won't be in the string
+        temp = "\r"
+        if temp in key or d == temp:
+            raise ValueError(f"Can not use character {temp!r} in hierarchical key or as"
+                             " delimiter if escaping the delimiter")
+        key = key.replace(escaped, temp)
+    hierarchy = key.split(d)
+    if temp:
+        hierarchy = [h.replace(temp, d) for h in hierarchy]
+    return tuple(hierarchy)
+
+
+def _existMany(uris: Sequence[ButlerURI]) -> List[bool]:
+    """Check for the existence of several resources.
+
+    Parameters
+    ----------
+    uris : `list` of `ButlerURI`
+        Resources to check.
+
+    Returns
+    -------
+    exists : `list` of `bool`
+        Whether each resource exists, in the same order as ``uris``.
+
+    Notes
+    -----
+    Local files and package resources are checked directly.  If more than
+    one resource requires a remote round trip the checks are issued from a
+    thread pool so that their latencies overlap.
+    """
+    remote = [uri for uri in uris if uri.scheme not in ("file", "resource")]
+    if len(remote) < 2:
+        return [uri.exists() for uri in uris]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(remote), 8)) as pool:
+        return list(pool.map(lambda uri: uri.exists(), uris))
 
 
 class Config(collections.abc.MutableMapping):
@@ -298,17 +408,44 @@ class Config(collections.abc.MutableMapping):
         """
         uri = ButlerURI(path)
         ext = uri.getExtension()
-        if ext == ".yaml":
-            log.debug("Opening YAML config file: %s", uri.geturl())
+        cached = _contentCache.get(uri) if ext in (".yaml", ".json") else None
+        if cached is not None:
+            log.debug("Using cached content of config file: %s", uri)
+            self._data = cached
+        elif ext == ".yaml":
+            log.debug("Opening YAML config file: %s", uri)
             content = uri.read()
             # Use a stream so we can name it
             stream = io.BytesIO(content)
             stream.name = uri.geturl()
-            self.__initFromYaml(stream)
+            cacheDir = os.environ.get(CONFIG_CACHE_DIR)
+            diskCache = ConfigDiskCache(cacheDir) if cacheDir else None
+            included: List[ButlerURI] = []
+            data = _contentCache.getParsed(content)
+            if data is not None:
+                log.debug("Using parsed content of identical file for %s", uri)
+            else:
+                data = diskCache.get(content) if diskCache is not None else None
+                if data is not None:
+                    log.debug("Using parsed content of %s from %s", uri, cacheDir)
+                else:
+                    data, included = _loadYaml(stream)
+                    if data is None:
+                        data = {}
+                    # Documents that include other files can not be
+                    # recognized from their own content alone.
+                    if diskCache is not None and not included:
+                        diskCache.put(content, data)
+                if not included:
+                    _contentCache.putParsed(content, data)
+            # The cache keeps the parsed content, so take a private copy.
+            _contentCache.put(uri, data, included)
+            self._data = copy.deepcopy(data)
         elif ext == ".json":
-            log.debug("Opening JSON config file: %s", uri.geturl())
+            log.debug("Opening JSON config file: %s", uri)
             content = uri.read()
             self.__initFromJson(content)
+            _contentCache.put(uri, copy.deepcopy(self._data))
         else:
             # This URI does not have a valid extension. It might be because
             # we ended up with a directory and not a file. Before we complain
@@ -459,29 +596,7 @@ class Config(collections.abc.MutableMapping):
             Hierarchical keys as a `list`.
         """
         if isinstance(key, str):
-            if not key[0].isalnum():
-                d = key[0]
-                key = key[1:]
-            else:
-                return [key, ]
-            escaped = f"\\{d}"
-            temp = None
-            if escaped in key:
-                # Complain at the attempt to escape the escape
-                doubled = fr"\{escaped}"
-                if doubled in key:
-                    raise ValueError(f"Escaping an escaped delimiter ({doubled} in {key})"
-                                     " is not yet supported.")
-                # Replace with a character that won't be in the string
-                temp = "\r"
-                if temp in key or d == temp:
-                    raise ValueError(f"Can not use character {temp!r} in hierarchical key or as"
-                                     " delimiter if escaping the delimiter")
-                key = key.replace(escaped, temp)
-            hierarchy = key.split(d)
-            if temp:
-                hierarchy = [h.replace(temp, d) for h in hierarchy]
-            return hierarchy
+            return list(_splitStringKey(key))
         elif isinstance(key, collections.abc.Iterable):
             return list(key)
         else:
@@ -849,7 +964,7 @@ class Config(collections.abc.MutableMapping):
             serialization will be returned as a string.
         """
         if format == "yaml":
-            return yaml.safe_dump(self._data, output, default_flow_style=False)
+            return yaml.dump(self._data, output, Dumper=yamlDumper, default_flow_style=False)
         elif format == "json":
             if output is not None:
                 json.dump(self._data, output, ensure_ascii=False)
@@ -1202,15 +1317,17 @@ class ConfigSubset(Config):
         else:
             # Reverse order so that high priority entries
             # update the object last.
+            candidates = []
             for pathDir in reversed(searchPaths):
                 if isinstance(pathDir, (str, ButlerURI)):
                     pathDir = ButlerURI(pathDir, forceDirectory=True)
-                    file = pathDir.join(configFile)
-                    if file.exists():
-                        self.filesRead.append(file)
-                        self._updateWithOtherConfigFile(file)
+                    candidates.append(pathDir.join(configFile))
                 else:
                     raise ValueError(f"Unexpected search path type encountered: {pathDir!r}")
+            for file, exists in zip(candidates, _existMany(candidates)):
+                if exists:
+                    self.filesRead.append(file)
+                    self._updateWithOtherConfigFile(file)
 
     def _updateWithOtherConfigFile(self, file):
         """Read in some defaults and update.
@@ -28,6 +28,7 @@ __all__ = ("LookupKey", "processLookupConfigs",
 
 import logging
 import re
+import sys
 from collections.abc import Mapping
 
 from typing import (
@@ -75,6 +76,8 @@ class LookupKey:
         full `DimensionGraph` is not provided.
     """
 
+    __slots__ = ("_name", "_dimensions", "_dataId", "_hash")
+
     def __init__(self, name: Optional[str] = None,
                  dimensions: Optional[Iterable[Union[str, Dimension]]] = None,
                  dataId: Optional[Dict[str, Any]] = None, *, universe: Optional[DimensionUniverse] = None):
@@ -101,7 +104,9 @@ class LookupKey:
                 else:
                     self._dimensions = universe.extract(dimension_names)
             else:
-                self._name = name
+                # Names are compared every time a key is found in a dict
+                # so make those comparisons identity checks.
+                self._name = sys.intern(name)
 
         elif dimensions is not None:
             if not isinstance(dimensions, DimensionGraph):
@@ -120,6 +125,10 @@ class LookupKey:
         # tuples so that it is not mutable
         self._dataId = frozenset(dataId.items()) if dataId is not None else None
 
+        # Keys are immutable and are mostly used to probe dicts so compute
+        # the hash once.
+        self._hash = hash((self._name, self._dimensions, self._dataId))
+
     def __str__(self) -> str:
         # For the simple case return the simple string
         if self._name:
@@ -146,6 +155,8 @@ class LookupKey:
         return f"{self.__class__.__name__}({params})"
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             return False
         if self._name == other._name and self._dimensions == other._dimensions and \
@@ -176,7 +187,12 @@ class LookupKey:
 
     def __hash__(self) -> int:
         """Hash the lookup to allow use as a key in a dict."""
-        return hash((self._name, self._dimensions, self._dataId))
+        return self._hash
+
+    def __reduce__(self) -> tuple:
+        # The cached hash depends on per-process string hashing so must
+        # not be pickled; reconstruct the key instead.
+        return (self.__class__, (self._name, self._dimensions, self.dataId))
 
     def clone(self, name: Optional[str] = None, dimensions: Optional[DimensionGraph] = None,
               dataId: Optional[Dict[str, Any]] = None) -> LookupKey:
@@ -172,9 +172,12 @@ class DimensionConfig(ConfigSubset):
             `StandardDimensionCombination` to an under-construction
             `DimensionUniverse`.
         """
-        for name, subconfig in self["elements"].items():
-            metadata = [ddl.FieldSpec.fromConfig(c) for c in subconfig.get("metadata", ())]
-            uniqueKeys = [ddl.FieldSpec.fromConfig(c, nullable=False) for c in subconfig.get("keys", ())]
+        # Work on plain dictionaries; nested Config lookups are much slower
+        # and nothing here needs hierarchical keys.
+        fieldSpecFromConfig = ddl.FieldSpec.fromConfig
+        for name, subconfig in self["elements"].toDict().items():
+            metadata = [fieldSpecFromConfig(c) for c in subconfig.get("metadata", ())]
+            uniqueKeys = [fieldSpecFromConfig(c, nullable=False) for c in subconfig.get("keys", ())]
             if uniqueKeys:
                 uniqueKeys[0].primaryKey = True
             if subconfig.get("governor", False):
@@ -30,9 +30,11 @@ __all__ = ("DataCoordinate", "DataId", "DataIdKey", "DataIdValue", "SerializedDa
 
 from abc import abstractmethod
 import numbers
+import operator
 from typing import (
     AbstractSet,
     Any,
+    Callable,
     Dict,
     Iterator,
     Mapping,
@@ -46,6 +48,7 @@ from pydantic import BaseModel
 from lsst.sphgeom import Region
 from ..named import NamedKeyDict, NamedKeyMapping, NameLookupMapping, NamedValueAbstractSet
 from ..timespan import Timespan
+from ..utils import cached_getter
 from ._elements import Dimension, DimensionElement
 from ._graph import DimensionGraph
 from ._records import DimensionRecord, SerializedDimensionRecord
@@ -189,13 +192,12 @@ class DataCoordinate(NamedKeyMapping[Dimension, DataIdValue]):
         KeyError
             Raised if a key-value pair for a required dimension is missing.
         """
-        d: Dict[str, DataIdValue] = {}
+        d: Dict[str, DataIdValue]
         if isinstance(mapping, DataCoordinate):
-            if graph is None:
-                if not kwargs:
-                    # Already standardized to exactly what we want.
-                    return mapping
-            elif kwargs.keys().isdisjoint(graph.dimensions.names):
+            if not kwargs:
+                # Already standardized; at most we need a subset.
+                return mapping if graph is None else mapping.subset(graph)
+            elif graph is not None and kwargs.keys().isdisjoint(graph.dimensions.names):
                 # User provided kwargs, but told us not to use them by
                 # passing in dimensions that are disjoint from those kwargs.
                 # This is not necessarily user error - it's a useful pattern
@@ -204,14 +206,17 @@ class DataCoordinate(NamedKeyMapping[Dimension, DataIdValue]):
                 return mapping.subset(graph)
             assert universe is None or universe == mapping.universe
             universe = mapping.universe
-            d.update((name, mapping[name]) for name in mapping.graph.required.names)
+            d = mapping.byName()
             if mapping.hasFull():
                 d.update((name, mapping[name]) for name in mapping.graph.implied.names)
         elif isinstance(mapping, NamedKeyMapping):
-            d.update(mapping.byName())
+            d = mapping.byName()
         elif mapping is not None:
-            d.update(mapping)
-        d.update(kwargs)
+            d = dict(mapping)
+        else:
+            d = {}
+        if kwargs:
+            d.update(kwargs)
         if graph is None:
             if defaults is not None:
                 universe = defaults.universe
@@ -227,16 +232,20 @@ class DataCoordinate(NamedKeyMapping[Dimension, DataIdValue]):
             else:
                 for k, v in defaults.items():
                     d.setdefault(k.name, v)
+        # Use map over the bound __getitem__ so the lookups happen without
+        # a Python-level loop.
         if d.keys() >= graph.dimensions.names:
-            values = tuple(d[name] for name in graph._dataCoordinateIndices.keys())
+            values = tuple(map(d.__getitem__, graph._dataCoordinateNames))
         else:
             try:
-                values = tuple(d[name] for name in graph.required.names)
+                values = tuple(map(d.__getitem__, graph._requiredNames))
             except KeyError as err:
                 raise KeyError(f"No value in data ID ({mapping}) for required dimension {err}.") from err
         # Some backends cannot handle numpy.int64 type which is a subclass of
-        # numbers.Integral; convert that to int.
-        values = tuple(int(val) if isinstance(val, numbers.Integral)  # type: ignore
+        # numbers.Integral; convert that to int.  Plain int and str values
+        # are checked for first since isinstance against the ABC is slow.
+        values = tuple(val if type(val) is int or type(val) is str
+                       else int(val) if isinstance(val, numbers.Integral)  # type: ignore
                        else val for val in values)
         return _BasicTupleDataCoordinate(graph, values)
 
@@ -320,9 +329,25 @@ class DataCoordinate(NamedKeyMapping[Dimension, DataIdValue]):
         return hash((self.graph,) + tuple(self[d.name] for d in self.graph.required))
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, DataCoordinate):
+            if isinstance(other, NamedKeyMapping):
+                keys = other.names
+            elif isinstance(other, Mapping):
+                keys = other.keys()
+            else:
+                keys = None
+            # A mapping whose keys do not lie between our required dimensions
+            # and all of our dimensions cannot standardize to a data ID with
+            # our graph, so don't bother constructing one.
+            if keys is not None and not (self.graph.required.names <= keys <= self.graph.dimensions.names):
+                return False
             other = DataCoordinate.standardize(other, universe=self.universe)
-        return self.graph == other.graph and all(self[d.name] == other[d.name] for d in self.graph.required)
+        if self.graph != other.graph:
+            return False
+        names = self.graph._requiredNames
+        return tuple(map(self.__getitem__, names)) == tuple(map(other.__getitem__, names))
 
     def __repr__(self) -> str:
         # We can't make repr yield something that could be exec'd here without
@@ -751,6 +776,13 @@ class _DataCoordinateFullView(NamedKeyMapping[Dimension, DataIdValue]):
         # Docstring inherited from `NamedKeyMapping`.
         return self.keys().names
 
+    def byName(self) -> Dict[str, DataIdValue]:
+        # Docstring inherited from `NamedKeyMapping`.
+        # Look up by name directly rather than going through the values view,
+        # which would look up each value by `Dimension`.
+        target = self._target
+        return {name: target[name] for name in self.names}
+
 
 class _DataCoordinateRecordsView(NamedKeyMapping[DimensionElement, Optional[DimensionRecord]]):
     """View class for `DataCoordinate.records`.
@@ -795,6 +827,11 @@ class _DataCoordinateRecordsView(NamedKeyMapping[DimensionElement, Optional[Dime
         # Docstring inherited from `NamedKeyMapping`.
         return self.keys().names
 
+    def byName(self) -> Dict[str, Optional[DimensionRecord]]:
+        # Docstring inherited from `NamedKeyMapping`.
+        target = self._target
+        return {name: target._record(name) for name in self.names}
+
 
 class _BasicTupleDataCoordinate(DataCoordinate):
     """Standard implementation of `DataCoordinate`.
@@ -818,8 +855,22 @@ class _BasicTupleDataCoordinate(DataCoordinate):
     def __init__(self, graph: DimensionGraph, values: Tuple[DataIdValue, ...]):
         self._graph = graph
         self._values = values
+        self._hash: Optional[int] = None
 
-    __slots__ = ("_graph", "_values")
+    __slots__ = ("_graph", "_values", "_hash")
+
+    def __reduce__(self) -> tuple:
+        # The cached hash is not pickled; string hashes are only stable
+        # within a single process.
+        return (_BasicTupleDataCoordinate, (self._graph, self._values))
+
+    def __hash__(self) -> int:
+        # Docstring inherited from DataCoordinate.
+        # Data IDs are used heavily as dict keys and set members, so compute
+        # the hash once; required values always come first in _values.
+        if self._hash is None:
+            self._hash = hash((self._graph,) + self._values[:len(self._graph.required)])
+        return self._hash
 
     @property
     def graph(self) -> DimensionGraph:
@@ -828,27 +879,121 @@ class _BasicTupleDataCoordinate(DataCoordinate):
 
     def __getitem__(self, key: DataIdKey) -> DataIdValue:
         # Docstring inherited from DataCoordinate.
-        if isinstance(key, Dimension):
+        # String keys are by far the most common, and checking for them
+        # first is much cheaper than an isinstance test against Dimension.
+        if not isinstance(key, str) and isinstance(key, Dimension):
             key = key.name
-        index = self._graph._dataCoordinateIndices[key]
         try:
-            return self._values[index]
+            return self._values[self._graph._dataCoordinateIndices[key]]
         except IndexError:
             # Caller asked for an implied dimension, but this object only has
             # values for the required ones.
             raise KeyError(key) from None
 
+    def __contains__(self, key: Any) -> bool:
+        # Docstring inherited from collections.abc.Mapping.
+        # Look up the index directly instead of relying on the Mapping
+        # implementation, which calls __getitem__ and catches KeyError.
+        if type(key) is not str and isinstance(key, Dimension):
+            key = key.name
+        index = self._graph._dataCoordinateIndices.get(key)
+        return index is not None and index < len(self._values)
+
+    def get(self, key: DataIdKey, default: Any = None) -> Any:
+        # Docstring inherited from NamedKeyMapping.
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __eq__(self, other: Any) -> bool:
+        # Docstring inherited from DataCoordinate.
+        if isinstance(other, _BasicTupleDataCoordinate):
+            if self is other:
+                return True
+            # Graphs are cached by the universe, so they are usually the
+            # same object when they are equal.
+            if self._graph is not other._graph and self._graph != other._graph:
+                return False
+            # Required values come first, in the same order for both.
+            n = len(self._graph.required)
+            return self._values[:n] == other._values[:n]
+        return super().__eq__(other)
+
+    def __lt__(self, other: Any) -> bool:
+        # Docstring inherited from DataCoordinate.
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        if self._graph is other._graph:
+            # Both sides have the same (dimension, value) keys in the same
+            # order, so comparing items reduces to comparing the values.
+            n = len(self._graph.required)
+            return self._values[:n] < other._values[:n]
+        return super().__lt__(other)
+
+    def byName(self) -> Dict[str, DataIdValue]:
+        # Docstring inherited from NamedKeyMapping.
+        # Values for required dimensions come first, in the same order.
+        return dict(zip(self._graph._requiredNames, self._values))
+
     def subset(self, graph: DimensionGraph) -> DataCoordinate:
         # Docstring inherited from DataCoordinate.
         if self._graph == graph:
             return self
         elif self.hasFull() or self._graph.required >= graph.dimensions:
-            return _BasicTupleDataCoordinate(
-                graph,
-                tuple(self[k] for k in graph._dataCoordinateIndices.keys()),
-            )
+            return _BasicTupleDataCoordinate(graph, self._subsetValues(graph._dataCoordinateNames))
         else:
-            return _BasicTupleDataCoordinate(graph, tuple(self[k] for k in graph.required.names))
+            return _BasicTupleDataCoordinate(graph, self._subsetValues(graph._requiredNames))
+
+    def _subsetValues(self, names: Tuple[str, ...]) -> Tuple[DataIdValue, ...]:
+        """Return the values for the given dimensions.
+
+        Parameters
+        ----------
+        names : `tuple` [ `str` ]
+            Names of the dimensions whose values should be returned.
+
+        Returns
+        -------
+        values : `tuple`
+            Values for the given dimensions, in the same order.
+
+        Raises
+        ------
+        KeyError
+            Raised if ``self`` does not have a value for one of the given
+            dimensions.
+        """
+        n = len(names)
+        if n <= len(self._values) and self._graph._dataCoordinateNames[:n] == names:
+            # The requested dimensions are a prefix of ours (e.g. the
+            # required dimensions of a subset that drops only the trailing
+            # ones), so we can just slice our values.
+            return self._values[:n]
+        # Index directly into our values rather than calling __getitem__ for
+        # each key; on failure, fall back to that to get the right exception.
+        # The indices only depend on the two graphs, so an itemgetter for
+        # them (and the number of values it needs) is cached on ours.
+        cache = self._graph._subsetGetterCache
+        cached = cache.get(names)
+        if cached is None:
+            try:
+                indices = [self._graph._dataCoordinateIndices[k] for k in names]
+            except KeyError:
+                return tuple(self[k] for k in names)
+            getter: Callable[[tuple], tuple]
+            if len(indices) == 1:
+                # itemgetter with a single index returns a bare value, but
+                # with a slice it returns a tuple.
+                getter = operator.itemgetter(slice(indices[0], indices[0] + 1))
+            else:
+                getter = operator.itemgetter(*indices)
+            cached = (getter, max(indices) + 1)
+            cache[names] = cached
+        getter, size = cached
+        if len(self._values) < size:
+            return tuple(self[k] for k in names)
+        return getter(self._values)
 
     def union(self, other: DataCoordinate) -> DataCoordinate:
         # Docstring inherited from DataCoordinate.
@@ -884,12 +1029,21 @@ class _BasicTupleDataCoordinate(DataCoordinate):
                  ) -> DataCoordinate:
         # Docstring inherited from DataCoordinate
         values = self._values
+        if isinstance(records, NamedKeyMapping):
+            # Resolve the mapping to a plain name-keyed dict once, up front;
+            # _ExpandedTupleDataCoordinate would do this anyway, and it makes
+            # the lookups below plain dict lookups.
+            records = records.byName()
         if not self.hasFull():
             # Extract a complete values tuple from the attributes of the given
             # records.  It's possible for these to be inconsistent with
             # self._values (which is a serious problem, of course), but we've
             # documented this as a no-checking API.
-            values += tuple(getattr(records[d.name], d.primaryKey.name) for d in self._graph.implied)
+            # A list comprehension is measurably cheaper than a generator
+            # here; the tuple concatenation itself is just a copy.
+            values += tuple([
+                getattr(records[name], key) for name, key in self._graph._impliedPrimaryKeyNames
+            ])
         return _ExpandedTupleDataCoordinate(self._graph, values, records)
 
     def hasFull(self) -> bool:
@@ -933,16 +1087,23 @@ class _ExpandedTupleDataCoordinate(_BasicTupleDataCoordinate):
                  records: NameLookupMapping[DimensionElement, Optional[DimensionRecord]]):
         super().__init__(graph, values)
         assert super().hasFull(), "This implementation requires full dimension records."
+        if isinstance(records, NamedKeyMapping):
+            # Lookups in _record are always by name, and are much faster in a
+            # plain dict than through NamedKeyMapping.__getitem__.
+            records = records.byName()
         self._records = records
 
-    __slots__ = ("_records",)
+    __slots__ = ("_records", "_cached_region", "_cached_timespan")
+
+    def __reduce__(self) -> tuple:
+        # See _BasicTupleDataCoordinate.__reduce__.
+        return (_ExpandedTupleDataCoordinate, (self._graph, self._values, self._records))
 
     def subset(self, graph: DimensionGraph) -> DataCoordinate:
         # Docstring inherited from DataCoordinate.
         if self._graph == graph:
             return self
-        return _ExpandedTupleDataCoordinate(graph,
-                                            tuple(self[k] for k in graph._dataCoordinateIndices.keys()),
+        return _ExpandedTupleDataCoordinate(graph, self._subsetValues(graph._dataCoordinateNames),
                                             records=self._records)
 
     def expanded(self, records: NameLookupMapping[DimensionElement, Optional[DimensionRecord]]
@@ -998,3 +1159,17 @@ class _ExpandedTupleDataCoordinate(_BasicTupleDataCoordinate):
     def _record(self, name: str) -> Optional[DimensionRecord]:
         # Docstring inherited from DataCoordinate.
         return self._records[name]
+
+    @property
+    @cached_getter
+    def region(self) -> Optional[Region]:
+        # Docstring inherited from DataCoordinate.
+        # Records never change, so the intersection only needs to be
+        # computed once.
+        return super().region
+
+    @property
+    @cached_getter
+    def timespan(self) -> Optional[Timespan]:
+        # Docstring inherited from DataCoordinate.
+        return super().timespan
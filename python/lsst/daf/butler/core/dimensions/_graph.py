@@ -29,6 +29,7 @@ from types import MappingProxyType
 from typing import (
     AbstractSet,
     Any,
+    Callable,
     Dict,
     Iterable,
     Iterator,
@@ -126,16 +127,32 @@ class DimensionGraph:
             if dimensions is not None:
                 raise TypeError("Only one of 'dimensions' and 'names' may be provided.")
             conformedNames = set(names)
-        if conform:
-            universe.expandDimensionNameSet(conformedNames)
-        # Look in the cache of existing graphs, with the expanded set of names.
+        # Look in the cache of existing graphs.  Names are very often already
+        # complete (e.g. they came from another graph), so try that before
+        # expanding them; cache keys are always complete sets of names.
         cacheKey = frozenset(conformedNames)
         self = universe._cache.get(cacheKey, None)
         if self is not None:
             return self
+        if conform:
+            universe.expandDimensionNameSet(conformedNames)
+            # Look again, with the expanded set of names.
+            cacheKey = frozenset(conformedNames)
+            self = universe._cache.get(cacheKey, None)
+            if self is not None:
+                return self
+            cacheable = True
+        else:
+            # The caller vouches for the names, but only cache the graph if
+            # they really are complete, since the lookup above relies on
+            # every cached graph being complete.
+            expandedNames = set(conformedNames)
+            universe.expandDimensionNameSet(expandedNames)
+            cacheable = len(expandedNames) == len(conformedNames)
         # This is apparently a new graph.  Create it, and add it to the cache.
         self = super().__new__(cls)
-        universe._cache[cacheKey] = self
+        if cacheable:
+            universe._cache[cacheKey] = self
         self.universe = universe
         # Reorder dimensions by iterating over the universe (which is
         # ordered already) and extracting the ones in the set.
@@ -145,6 +162,8 @@ class DimensionGraph:
         self.elements = NamedValueSet(e for e in universe.getStaticElements()
                                       if e.required.names <= self.dimensions.names).freeze()
         self._finish()
+        if cacheable:
+            universe._graphsByMask[self._mask] = self
         return self
 
     def _finish(self) -> None:
@@ -180,10 +199,25 @@ class DimensionGraph:
         # (many!) DataCoordinates will share the same DimensionGraph, and
         # we want them to be lightweight.  The order here is what's convenient
         # for DataCoordinate: all required dimensions before all implied
-        # dimensions.
+        # dimensions.  We also keep the names in that order as tuples, since
+        # DataCoordinate construction iterates over them a lot.
+        self._dataCoordinateNames: Tuple[str, ...] = tuple(
+            itertools.chain(self.required.names, self.implied.names)
+        )
+        self._requiredNames: Tuple[str, ...] = self._dataCoordinateNames[:len(self.required)]
         self._dataCoordinateIndices: Dict[str, int] = {
-            name: i for i, name in enumerate(itertools.chain(self.required.names, self.implied.names))
+            name: i for i, name in enumerate(self._dataCoordinateNames)
         }
+        # Cache of itemgetters that extract the values of another graph's
+        # DataCoordinates from this graph's DataCoordinate values, along with
+        # the number of values they need, keyed by that graph's
+        # _requiredNames or _dataCoordinateNames.
+        self._subsetGetterCache: Dict[Tuple[str, ...], Tuple[Callable[[tuple], tuple], int]] = {}
+
+        # Represent the dimensions as a bitmask of their indices in the
+        # universe, so set comparisons between graphs are integer operations.
+        indices = self.universe._dimensionIndices
+        self._mask: int = sum(1 << indices[name] for name in self.dimensions.names)
 
     def __getnewargs__(self) -> tuple:
         return (self.universe, None, tuple(self.dimensions.names), False)
@@ -303,6 +337,8 @@ class DimensionGraph:
 
         Returns `True` if either operand is the empty.
         """
+        if self.universe is other.universe:
+            return not (self._mask & other._mask)
         return self.dimensions.isdisjoint(other.dimensions)
 
     def issubset(self, other: DimensionGraph) -> bool:
@@ -310,6 +346,8 @@ class DimensionGraph:
 
         Returns `True` if ``self`` is empty.
         """
+        if self.universe is other.universe:
+            return (self._mask & other._mask) == self._mask
         return self.dimensions <= other.dimensions
 
     def issuperset(self, other: DimensionGraph) -> bool:
@@ -317,11 +355,15 @@ class DimensionGraph:
 
         Returns `True` if ``other`` is empty.
         """
+        if self.universe is other.universe:
+            return (self._mask & other._mask) == other._mask
         return self.dimensions >= other.dimensions
 
     def __eq__(self, other: Any) -> bool:
         """Test the arguments have exactly the same dimensions & elements."""
         if isinstance(other, DimensionGraph):
+            if self.universe is other.universe:
+                return self._mask == other._mask
             return self.dimensions == other.dimensions
         else:
             return False
@@ -331,18 +373,22 @@ class DimensionGraph:
 
     def __le__(self, other: DimensionGraph) -> bool:
         """Test whether ``self`` is a subset of ``other``."""
-        return self.dimensions <= other.dimensions
+        return self.issubset(other)
 
     def __ge__(self, other: DimensionGraph) -> bool:
         """Test whether ``self`` is a superset of ``other``."""
-        return self.dimensions >= other.dimensions
+        return self.issuperset(other)
 
     def __lt__(self, other: DimensionGraph) -> bool:
         """Test whether ``self`` is a strict subset of ``other``."""
+        if self.universe is other.universe:
+            return self._mask != other._mask and (self._mask & other._mask) == self._mask
         return self.dimensions < other.dimensions
 
     def __gt__(self, other: DimensionGraph) -> bool:
         """Test whether ``self`` is a strict superset of ``other``."""
+        if self.universe is other.universe:
+            return self._mask != other._mask and (self._mask & other._mask) == other._mask
         return self.dimensions > other.dimensions
 
     def union(self, *others: DimensionGraph) -> DimensionGraph:
@@ -353,6 +399,17 @@ class DimensionGraph:
         in graphs whenever multiple dimensions are present, and those
         dependency dimensions could have been provided by different operands.
         """
+        mask = self._mask
+        for other in others:
+            if other.universe is not self.universe:
+                break
+            mask |= other._mask
+        else:
+            # All graphs are from the same universe, so we can look for an
+            # existing graph with the combined bitmask.
+            result = self.universe._graphsByMask.get(mask)
+            if result is not None:
+                return result
         names = set(self.names).union(*[other.names for other in others])
         return DimensionGraph(self.universe, names=names)
 
@@ -361,6 +418,16 @@ class DimensionGraph:
 
         See also `union`.
         """
+        mask = self._mask
+        for other in others:
+            if other.universe is not self.universe:
+                break
+            mask &= other._mask
+        else:
+            # See comment in union.
+            result = self.universe._graphsByMask.get(mask)
+            if result is not None:
+                return result
         names = set(self.names).intersection(*[other.names for other in others])
         return DimensionGraph(self.universe, names=names)
 
@@ -413,6 +480,17 @@ class DimensionGraph:
         order.extend(element for element in self.elements if element.name not in done)
         return tuple(order)
 
+    @property  # type: ignore
+    @cached_getter
+    def _impliedPrimaryKeyNames(self) -> Tuple[Tuple[str, str], ...]:
+        """Pairs of implied dimension name and primary key field name.
+
+        These are in the same order as the implied dimensions in
+        `DataCoordinate` values tuples, and are used to extract those values
+        from dimension records (`tuple` [ `tuple` [ `str`, `str` ] ]).
+        """
+        return tuple((d.name, d.primaryKey.name) for d in self.implied)
+
     @property
     def spatial(self) -> NamedValueAbstractSet[TopologicalFamily]:
         """Families represented by the spatial elements in this graph."""
@@ -23,8 +23,9 @@ from __future__ import annotations
 
 __all__ = ["DimensionUniverse"]
 
-import math
+import itertools
 import pickle
+import sys
 from typing import (
     ClassVar,
     Dict,
@@ -34,6 +35,7 @@ from typing import (
     Mapping,
     Optional,
     Set,
+    Tuple,
     TYPE_CHECKING,
     TypeVar,
     Union,
@@ -102,12 +104,16 @@ class DimensionUniverse:
     ) -> DimensionUniverse:
         # Try to get a version first, to look for existing instances; try to
         # do as little work as possible at this stage.
+        dimensionConfig: Optional[DimensionConfig] = None
         if version is None:
-            if builder is None:
-                config = DimensionConfig(config)
+            if builder is not None:
+                version = builder.version
+            elif isinstance(config, DimensionConfig):
+                # Don't copy the config just to read the version.
                 version = config["version"]
             else:
-                version = builder.version
+                dimensionConfig = DimensionConfig(config)
+                version = dimensionConfig["version"]
 
         # See if an equivalent instance already exists.
         self: Optional[DimensionUniverse] = cls._instances.get(version)
@@ -115,9 +121,11 @@ class DimensionUniverse:
             return self
 
         # Ensure we have a builder, building one from config if necessary.
+        # Don't construct the config again if we already did that above.
         if builder is None:
-            config = DimensionConfig(config)
-            builder = config.makeBuilder()
+            if dimensionConfig is None:
+                dimensionConfig = DimensionConfig(config)
+            builder = dimensionConfig.makeBuilder()
 
         # Delegate to the builder for most of the construction work.
         builder.finish()
@@ -127,8 +135,12 @@ class DimensionUniverse:
         self = object.__new__(cls)
         assert self is not None
         self._cache = {}
+        self._graphsByMask = {}
         self._dimensions = builder.dimensions
         self._elements = builder.elements
+        # Plain name-keyed mapping for __getitem__ and get, which skips the
+        # Python-level NamedValueAbstractSet.__getitem__.
+        self._elementsByName = self._elements.asMapping()
         self._topology = builder.topology
         self._packers = builder.packers
         self.dimensionConfig = builder.config
@@ -140,6 +152,41 @@ class DimensionUniverse:
         for element in self._elements:
             element.universe = self
 
+        # Build a mapping from each dimension name to the names of all of the
+        # dimensions it depends on, directly or indirectly (including itself),
+        # for expandDimensionNameSet.
+        dependencies = {
+            d.name: tuple(itertools.chain(d.required.names, d.implied.names)) for d in self._dimensions
+        }
+        self._dimensionClosureNames = {}
+        for name in dependencies:
+            closure = {name}
+            todo = [name]
+            while todo:
+                for dependency in dependencies[todo.pop()]:
+                    if dependency not in closure:
+                        closure.add(dependency)
+                        todo.append(dependency)
+            self._dimensionClosureNames[name] = frozenset(closure)
+
+        # Build mappings from element to index.  These are used for
+        # topological-sort comparison operators in DimensionElement itself.
+        # Names are interned so lookups with them (or with other interned
+        # strings) can succeed on identity alone.
+        self._elementIndices = dict(zip(map(sys.intern, self._elements.names), range(len(self._elements))))
+        # Elements in the same order, so an index can be mapped back to its
+        # element without going through the name.
+        self._elementsByIndex = tuple(self._elements)
+        # Same for dimension to index, sorted topologically across required
+        # and implied.  This is used for encode/decode and for the bitmasks in
+        # DimensionGraph, so it must be set before any graphs are constructed.
+        self._dimensionIndices = dict(
+            zip(map(sys.intern, self._dimensions.names), range(len(self._dimensions)))
+        )
+        # Number of bytes needed for one bit per dimension; see
+        # getEncodeLength.
+        self._encodeLength = (len(self._dimensions) + 7) // 8
+
         # Add attribute for special subsets of the graph.
         self.empty = DimensionGraph(self, (), conform=False)
 
@@ -151,24 +198,13 @@ class DimensionUniverse:
         self._version = version
         cls._instances[self._version] = self
 
-        # Build mappings from element to index.  These are used for
-        # topological-sort comparison operators in DimensionElement itself.
-        self._elementIndices = {
-            name: i for i, name in enumerate(self._elements.names)
-        }
-        # Same for dimension to index, sorted topologically across required
-        # and implied.  This is used for encode/decode.
-        self._dimensionIndices = {
-            name: i for i, name in enumerate(self._dimensions.names)
-        }
-
         return self
 
     def __repr__(self) -> str:
         return f"DimensionUniverse({self._version})"
 
     def __getitem__(self, name: str) -> DimensionElement:
-        return self._elements[name]
+        return self._elementsByName[name]
 
     def get(self, name: str, default: Optional[DimensionElement] = None) -> Optional[DimensionElement]:
         """Return the `DimensionElement` with the given name or a default.
@@ -186,7 +222,7 @@ class DimensionUniverse:
         element : `DimensionElement`
             The named element.
         """
-        return self._elements.get(name, default)
+        return self._elementsByName.get(name, default)
 
     def getStaticElements(self) -> NamedValueAbstractSet[DimensionElement]:
         """Return a set of all static elements in this universe.
@@ -309,20 +345,10 @@ class DimensionUniverse:
         names : `set` [ `str` ]
             A true `set` of dimension names, to be expanded in-place.
         """
-        # Keep iterating until the set of names stops growing.  This is not as
-        # efficient as it could be, but we work pretty hard cache
-        # DimensionGraph instances to keep actual construction rare, so that
-        # shouldn't matter.
-        oldSize = len(names)
-        while True:
-            # iterate over a temporary copy so we can modify the original
-            for name in tuple(names):
-                names.update(self._dimensions[name].required.names)
-                names.update(self._dimensions[name].implied.names)
-            if oldSize == len(names):
-                break
-            else:
-                oldSize = len(names)
+        # The full set of dependencies of each dimension is precomputed, so
+        # this is just one union.
+        closures = self._dimensionClosureNames
+        names.update(*[closures[name] for name in names])
 
     def extract(self, iterable: Iterable[Union[Dimension, str]]) -> DimensionGraph:
         """Construct graph from iterable.
@@ -345,12 +371,11 @@ class DimensionUniverse:
         graph : `DimensionGraph`
             A `DimensionGraph` instance containing all given dimensions.
         """
-        names = set()
-        for item in iterable:
-            try:
-                names.add(item.name)  # type: ignore
-            except AttributeError:
-                names.add(item)
+        if isinstance(iterable, DimensionGraph) and iterable.universe is self:
+            return iterable
+        if isinstance(iterable, NamedValueAbstractSet):
+            return DimensionGraph(universe=self, names=iterable.names)
+        names: Set[str] = {item if isinstance(item, str) else item.name for item in iterable}
         return DimensionGraph(universe=self, names=names)
 
     def sorted(self, elements: Iterable[Union[E, str]], *, reverse: bool = False) -> List[E]:
@@ -372,10 +397,14 @@ class DimensionUniverse:
         sorted : `list` of `DimensionElement`
             A sorted list containing the same elements that were given.
         """
-        s = set(elements)
-        result = [element for element in self._elements if element in s or element.name in s]
-        if reverse:
-            result.reverse()
+        # Sort the indices of just the elements we were given, instead of
+        # scanning the full universe; names that aren't in the universe are
+        # dropped.
+        indices = self._elementIndices
+        names: Set[str] = {element if isinstance(element, str) else element.name for element in elements}
+        order = sorted([indices[name] for name in names if name in indices], reverse=reverse)
+        elementsByIndex = self._elementsByIndex
+        result = [elementsByIndex[i] for i in order]
         # mypy thinks this can return DimensionElements even if all the user
         # passed it was Dimensions; we know better.
         return result  # type: ignore
@@ -408,7 +437,7 @@ class DimensionUniverse:
         See `DimensionGraph.encode` and `DimensionGraph.decode` for more
         information.
         """
-        return math.ceil(len(self._dimensions)/8)
+        return self._encodeLength
 
     @classmethod
     def _unpickle(cls, version: int) -> DimensionUniverse:
@@ -454,16 +483,26 @@ class DimensionUniverse:
 
     _cache: Dict[FrozenSet[str], DimensionGraph]
 
+    _graphsByMask: Dict[int, DimensionGraph]
+
     _dimensions: NamedValueAbstractSet[Dimension]
 
     _elements: NamedValueAbstractSet[DimensionElement]
 
+    _elementsByName: Mapping[str, DimensionElement]
+
     _topology: Mapping[TopologicalSpace, NamedValueAbstractSet[TopologicalFamily]]
 
     _dimensionIndices: Dict[str, int]
 
+    _dimensionClosureNames: Dict[str, FrozenSet[str]]
+
     _elementIndices: Dict[str, int]
 
+    _elementsByIndex: Tuple[DimensionElement, ...]
+
+    _encodeLength: int
+
     _packers: Dict[str, DimensionPackerFactory]
 
     _version: int
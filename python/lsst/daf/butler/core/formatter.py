@@ -672,8 +672,9 @@ class FormatterFactory:
         """
         names = (LookupKey(name=entity),) if isinstance(entity, str) else entity._lookupNames()
         matchKey, formatter, formatter_kwargs = self._mappingFactory.getClassFromRegistryWithMatch(names)
-        log.debug("Retrieved formatter %s from key '%s' for entity '%s'", getFullTypeName(formatter),
-                  matchKey, entity)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Retrieved formatter %s from key '%s' for entity '%s'", getFullTypeName(formatter),
+                      matchKey, entity)
 
         return matchKey, formatter, formatter_kwargs
 
@@ -722,8 +723,9 @@ class FormatterFactory:
         """
         names = (LookupKey(name=entity),) if isinstance(entity, str) else entity._lookupNames()
         matchKey, formatter = self._mappingFactory.getFromRegistryWithMatch(names, *args, **kwargs)
-        log.debug("Retrieved formatter %s from key '%s' for entity '%s'", getFullTypeName(formatter),
-                  matchKey, entity)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Retrieved formatter %s from key '%s' for entity '%s'", getFullTypeName(formatter),
+                      matchKey, entity)
 
         return matchKey, formatter
 
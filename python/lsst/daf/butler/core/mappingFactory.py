@@ -126,7 +126,13 @@ class MappingFactory:
                 except KeyError:
                     pass
                 else:
-                    return key, getClassOf(entry["type"]), entry["kwargs"]
+                    cls = entry.get("class")
+                    if cls is None:
+                        # Importing a type from its name is relatively
+                        # expensive so only do it the first time this
+                        # entry is used.
+                        cls = entry["class"] = getClassOf(entry["type"])
+                    return key, cls, entry["kwargs"]
 
         # Convert list to a string for error reporting
         msg = ", ".join(str(k) for k in attempts)
@@ -253,11 +259,12 @@ class MappingFactory:
         if key in self._registry and not overwrite:
             # Compare the class strings since dynamic classes can be the
             # same thing but be different.
-            if str(self._registry[key]) == str(typeName):
+            existing = self._registry[key]
+            if str(existing["type"]) == str(typeName) and existing["kwargs"] == kwargs:
                 return
 
             raise KeyError("Item with key {} already registered with different value"
-                           " ({} != {})".format(key, self._registry[key], typeName))
+                           " ({} != {})".format(key, existing["type"], typeName))
 
         self._registry[key] = {"type": typeName,
                                "kwargs": dict(**kwargs),
@@ -277,14 +284,18 @@ class MappingFactory:
         name : `LookupKey`
             Extracted name as a string or
         """
-        if isinstance(typeOrName, LookupKey):
+        # Check the exact types first since this is called for every
+        # candidate key on every lookup.
+        keyType = type(typeOrName)
+        if keyType is LookupKey or isinstance(typeOrName, LookupKey):
             return typeOrName
 
-        if isinstance(typeOrName, str):
+        if keyType is str or isinstance(typeOrName, str):
             name = typeOrName
-        elif hasattr(typeOrName, "name"):
-            name = typeOrName.name
         else:
-            raise ValueError("Cannot extract name from type")
+            try:
+                name = typeOrName.name
+            except AttributeError:
+                raise ValueError("Cannot extract name from type") from None
 
         return LookupKey(name=name)
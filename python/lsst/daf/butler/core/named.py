@@ -176,11 +176,12 @@ class NamedKeyDict(NamedKeyMutableMapping[K, V]):
         Raised when multiple keys have the same name.
     """
 
-    __slots__ = ("_dict", "_names",)
+    __slots__ = ("_dict", "_names", "_frozen")
 
     def __init__(self, *args: Any):
         self._dict: Dict[K, V] = dict(*args)
         self._names = {key.name: key for key in self._dict}
+        self._frozen = False
         assert len(self._names) == len(self._dict), "Duplicate names in keys."
 
     @property
@@ -193,7 +194,9 @@ class NamedKeyDict(NamedKeyMutableMapping[K, V]):
 
     def byName(self) -> Dict[str, V]:
         """Return a `dict` with names as keys and the ``self`` values."""
-        return dict(zip(self._names.keys(), self._dict.values()))
+        # Iterating over the names dict directly is a bit faster than going
+        # through a keys view, and its order matches _dict's.
+        return dict(zip(self._names, self._dict.values()))
 
     def __len__(self) -> int:
         return len(self._dict)
@@ -208,21 +211,30 @@ class NamedKeyDict(NamedKeyMutableMapping[K, V]):
         return "NamedKeyDict({{{}}})".format(", ".join(f"{repr(k)}: {repr(v)}" for k, v in self.items()))
 
     def __getitem__(self, key: Union[str, K]) -> V:
-        if isinstance(key, str):
+        # Exact str keys are by far the most common, and checking for them
+        # by type is cheaper than isinstance; the isinstance fallback keeps
+        # str subclasses (e.g. from SQLAlchemy) working.
+        if type(key) is str or isinstance(key, str):
             return self._dict[self._names[key]]
         else:
             return self._dict[key]
 
     def __setitem__(self, key: Union[str, K], value: V) -> None:
-        if isinstance(key, str):
+        if self._frozen:
+            raise TypeError("NamedKeyDict is frozen.")
+        if type(key) is str or isinstance(key, str):
             self._dict[self._names[key]] = value
         else:
-            assert self._names.get(key.name, key) == key, "Name is already associated with a different key."
+            names = self._names
+            name = key.name
+            assert names.get(name, key) == key, "Name is already associated with a different key."
             self._dict[key] = value
-            self._names[key.name] = key
+            names[name] = key
 
     def __delitem__(self, key: Union[str, K]) -> None:
-        if isinstance(key, str):
+        if self._frozen:
+            raise TypeError("NamedKeyDict is frozen.")
+        if type(key) is str or isinstance(key, str):
             del self._dict[self._names[key]]
             del self._names[key]
         else:
@@ -243,6 +255,7 @@ class NamedKeyDict(NamedKeyMutableMapping[K, V]):
         result = NamedKeyDict.__new__(NamedKeyDict)
         result._dict = dict(self._dict)
         result._names = dict(self._names)
+        result._frozen = False
         return result
 
     def freeze(self) -> NamedKeyMapping[K, V]:
@@ -258,8 +271,10 @@ class NamedKeyDict(NamedKeyMutableMapping[K, V]):
             to a new variable (and considering any previous references
             invalidated) should allow for more accurate static type checking.
         """
-        if not isinstance(self._dict, MappingProxyType):
-            self._dict = MappingProxyType(self._dict)  # type: ignore
+        # Mutators check this flag, rather than wrapping the dict in a
+        # MappingProxyType, so lookups on frozen objects stay as fast as
+        # possible.
+        self._frozen = True
         return self
 
 
@@ -347,13 +362,15 @@ class NameMappingSetView(NamedValueAbstractSet[K_co]):
         return self._mapping
 
     def __getitem__(self, key: Union[str, K_co]) -> K_co:
-        if isinstance(key, str):
+        if type(key) is str or isinstance(key, str):
             return self._mapping[key]
         else:
             return self._mapping[key.name]
 
     def __contains__(self, key: Any) -> bool:
-        return getattr(key, "name", key) in self._mapping
+        if type(key) is not str:
+            key = getattr(key, "name", key)
+        return key in self._mapping
 
     def __len__(self) -> int:
         return len(self._mapping)
@@ -362,19 +379,33 @@ class NameMappingSetView(NamedValueAbstractSet[K_co]):
         return iter(self._mapping.values())
 
     def __eq__(self, other: Any) -> bool:
-        if isinstance(other, NamedValueAbstractSet):
+        if self is other:
+            return True
+        if isinstance(other, NameMappingSetView):
+            # Compare the keys views of the backing dicts directly, which
+            # checks lengths first.
+            return self._mapping.keys() == other._mapping.keys()
+        elif isinstance(other, NamedValueAbstractSet):
             return self.names == other.names
         else:
             return set(self._mapping.values()) == other
 
     def __le__(self, other: AbstractSet[K]) -> bool:
-        if isinstance(other, NamedValueAbstractSet):
+        if self is other:
+            return True
+        if isinstance(other, NameMappingSetView):
+            return self._mapping.keys() <= other._mapping.keys()
+        elif isinstance(other, NamedValueAbstractSet):
             return self.names <= other.names
         else:
             return set(self._mapping.values()) <= other
 
     def __ge__(self, other: AbstractSet[K]) -> bool:
-        if isinstance(other, NamedValueAbstractSet):
+        if self is other:
+            return True
+        if isinstance(other, NameMappingSetView):
+            return self._mapping.keys() >= other._mapping.keys()
+        elif isinstance(other, NamedValueAbstractSet):
             return self.names >= other.names
         else:
             return set(self._mapping.values()) >= other
@@ -497,7 +528,19 @@ class NamedValueSet(NameMappingSetView[K], NamedValueMutableSet[K]):
     def issuperset(self, other: AbstractSet[K]) -> bool:
         return self >= other
 
+    def _checkNotFrozen(self) -> None:
+        """Raise `TypeError` if this set has been frozen."""
+        if self._frozen:
+            raise TypeError("NamedValueSet is frozen.")
+
+    def asMapping(self) -> Mapping[str, K]:
+        # Docstring inherited from NamedValueAbstractSet.
+        if self._frozen:
+            return MappingProxyType(self._mapping)
+        return self._mapping
+
     def __delitem__(self, name: str) -> None:
+        self._checkNotFrozen()
         del self._mapping[name]
 
     def add(self, element: K) -> None:
@@ -508,15 +551,21 @@ class NamedValueSet(NameMappingSetView[K], NamedValueMutableSet[K]):
         AttributeError
             Raised if the element does not have a ``.name`` attribute.
         """
+        self._checkNotFrozen()
         self._mapping[element.name] = element
 
     def clear(self) -> None:
         # Docstring inherited.
+        self._checkNotFrozen()
         self._mapping.clear()
 
     def remove(self, element: Union[str, K]) -> Any:
         # Docstring inherited.
-        del self._mapping[getattr(element, "name", element)]
+        self._checkNotFrozen()
+        if type(element) is str:
+            del self._mapping[element]
+        else:
+            del self._mapping[getattr(element, "name", element)]
 
     def discard(self, element: Union[str, K]) -> Any:
         # Docstring inherited.
@@ -527,6 +576,7 @@ class NamedValueSet(NameMappingSetView[K], NamedValueMutableSet[K]):
 
     def pop(self, *args: str) -> K:
         # Docstring inherited.
+        self._checkNotFrozen()
         if not args:
             return super().pop()
         else:
@@ -540,8 +590,8 @@ class NamedValueSet(NameMappingSetView[K], NamedValueMutableSet[K]):
         elements : `Iterable`
             Elements to add.
         """
-        for element in elements:
-            self.add(element)
+        self._checkNotFrozen()
+        self._mapping.update({element.name: element for element in elements})
 
     def copy(self) -> NamedValueSet[K]:
         """Return a new `NamedValueSet` with the same elements."""
@@ -562,8 +612,10 @@ class NamedValueSet(NameMappingSetView[K], NamedValueMutableSet[K]):
             to a new variable (and considering any previous references
             invalidated) should allow for more accurate static type checking.
         """
-        if not isinstance(self._mapping, MappingProxyType):
-            self._mapping = MappingProxyType(self._mapping)  # type: ignore
+        # See comment in NamedKeyDict.freeze.
+        self._frozen = True
         return self
 
     _mapping: Dict[str, K]
+
+    _frozen: bool = False
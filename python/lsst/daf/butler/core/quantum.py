@@ -160,12 +160,16 @@ class Quantum:
         return self._outputs
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Quantum):
             return False
-        for item in ("taskClass", "dataId", "initInputs", "inputs", "outputs"):
-            if getattr(self, item) != getattr(other, item):
-                return False
-        return True
+        # Compare the cheap attributes first; taskClass may need an import.
+        return (self._dataId == other._dataId
+                and self._initInputs == other._initInputs
+                and self._inputs == other._inputs
+                and self._outputs == other._outputs
+                and self.taskClass == other.taskClass)
 
     def __hash__(self) -> int:
         return hash((self.taskClass, self.dataId))
@@ -27,6 +27,7 @@ __all__ = (
 
 from typing import (
     Any,
+    ClassVar,
     Dict,
     Iterable,
     Iterator,
@@ -41,6 +42,13 @@ import functools
 import contextlib
 import httpx
 
+try:
+    # HTTP/2 support in httpx requires the optional h2 package.
+    import h2  # noqa: F401
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
 from ..core import (
     ButlerURI,
     Config,
@@ -104,6 +112,17 @@ class RemoteRegistry(Registry):
     defaults : `RegistryDefaults`
         Default collection search path and/or output `~CollectionType.RUN`
         collection.
+    writeable : `bool`
+        Whether this registry may be used to modify the remote repository.
+    client : `httpx.Client`, optional
+        HTTP client to use for all server requests.  If not provided a new
+        one is created.  Sharing a client between instances (as `copy` does)
+        lets them share its pool of keep-alive connections.
+    """
+
+    _universes: ClassVar[Dict[str, DimensionUniverse]] = {}
+    """Dimension universes already fetched from each server, keyed by the
+    string form of its URI.
     """
 
     @classmethod
@@ -131,7 +150,8 @@ class RemoteRegistry(Registry):
         server_uri = ButlerURI(config["db"])
         return cls(server_uri, defaults, writeable)
 
-    def __init__(self, server_uri: ButlerURI, defaults: RegistryDefaults, writeable: bool):
+    def __init__(self, server_uri: ButlerURI, defaults: RegistryDefaults, writeable: bool,
+                 client: Optional[httpx.Client] = None):
         self._db = server_uri
         self._defaults = defaults
 
@@ -140,8 +160,13 @@ class RemoteRegistry(Registry):
 
         self._dimensions: Optional[DimensionUniverse] = None
 
-        headers = {"user-agent": f"{getFullTypeName(self)}/{__version__}"}
-        self._client = httpx.Client(headers=headers)
+        if client is None:
+            headers = {"user-agent": f"{getFullTypeName(self)}/{__version__}"}
+            # With HTTP/2 concurrent requests are multiplexed over a single
+            # connection; httpx falls back to HTTP/1.1 if the server does not
+            # negotiate it.
+            client = httpx.Client(headers=headers, http2=_HAS_H2)
+        self._client = client
 
         # Does each API need to be sent the defaults so that the server
         # can use specific defaults each time?
@@ -166,7 +191,9 @@ class RemoteRegistry(Registry):
             # No need to copy, because `RegistryDefaults` is immutable; we
             # effectively copy on write.
             defaults = self.defaults
-        return type(self)(self._db, defaults, self.isWriteable())
+        # Reuse our client (and hence its open connections) rather than
+        # paying for new connections and TLS handshakes in the copy.
+        return type(self)(self._db, defaults, self.isWriteable(), client=self._client)
 
     @property
     def dimensions(self) -> DimensionUniverse:
@@ -174,13 +201,21 @@ class RemoteRegistry(Registry):
         if self._dimensions is not None:
             return self._dimensions
 
-        # Access /dimensions.json on server and cache it locally.
-        response = self._client.get(str(self._db.join("universe")))
-        response.raise_for_status()
-
-        config = DimensionConfig.fromString(response.text, format="json")
-        self._dimensions = DimensionUniverse(config)
-        return self._dimensions
+        # A server's universe does not change while this process is running,
+        # so other instances (including copies) talking to the same server
+        # can reuse what we have already fetched and parsed.
+        key = str(self._db)
+        universe = self._universes.get(key)
+        if universe is None:
+            # Access /dimensions.json on server and cache it locally.
+            response = self._client.get(str(self._db.join("universe")))
+            response.raise_for_status()
+
+            config = DimensionConfig.fromString(response.text, format="json")
+            universe = DimensionUniverse(config)
+            self._universes[key] = universe
+        self._dimensions = universe
+        return universe
 
     def refresh(self) -> None:
         # Docstring inherited from lsst.daf.butler.registry.Registry
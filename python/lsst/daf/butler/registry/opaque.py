@@ -29,6 +29,7 @@ from typing import (
     Any,
     ClassVar,
     Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     Optional,
@@ -72,6 +73,7 @@ class ByNameOpaqueTableStorage(OpaqueTableStorage):
         super().__init__(name=name)
         self._db = db
         self._table = table
+        self._fetchCache: Dict[FrozenSet[str], sqlalchemy.sql.Select] = {}
 
     def insert(self, *data: dict) -> None:
         # Docstring inherited from OpaqueTableStorage.
@@ -79,12 +81,19 @@ class ByNameOpaqueTableStorage(OpaqueTableStorage):
 
     def fetch(self, **where: Any) -> Iterator[dict]:
         # Docstring inherited from OpaqueTableStorage.
-        sql = self._table.select()
-        if where:
-            sql = sql.where(
-                sqlalchemy.sql.and_(*[self._table.columns[k] == v for k, v in where.items()])
-            )
-        for row in self._db.query(sql):
+        # SELECT statements depend only on the set of columns constrained,
+        # so build each one (with bind parameters for the values) only once.
+        key = frozenset(where)
+        sql = self._fetchCache.get(key)
+        if sql is None:
+            sql = self._table.select()
+            if where:
+                sql = sql.where(
+                    sqlalchemy.sql.and_(*[self._table.columns[k] == sqlalchemy.sql.bindparam(k)
+                                          for k in where])
+                )
+            self._fetchCache[key] = sql
+        for row in self._db.query(sql, where):
             yield dict(row)
 
     def delete(self, columns: Iterable[str], *rows: dict) -> None:
@@ -326,7 +326,9 @@ class Query(ABC):
         if records is not None:
             recordsForRow = {}
             for element in graph.elements:
-                key = tuple(dataId.subset(element.graph).values())
+                # dataId has values for all dimensions, so the key can be
+                # read directly instead of building a subset data ID.
+                key = tuple(dataId[name] for name in element.graph.required.names)
                 recordsForRow[element.name] = records[element.name].get(key)
             return dataId.expanded(recordsForRow)
         else:
@@ -21,7 +21,6 @@
 
 from __future__ import annotations
 
-from astropy.table import Table
 import itertools
 from numpy import array
 
@@ -52,6 +51,8 @@ def queryCollections(repo, glob, collection_type, chains):
     collections : `astropy.table.Table`
         A table containing information about collections.
     """
+    from astropy.table import Table
+
     butler = Butler(repo)
 
     if chains == "TABLE":
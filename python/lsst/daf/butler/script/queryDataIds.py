@@ -19,7 +19,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from astropy.table import Table as AstropyTable
 import numpy as np
 
 from .. import Butler
@@ -53,6 +52,8 @@ class _Table:
             The dataIds, sorted by spatial and temporal columns first, and then
             the rest of the columns, with duplicate dataIds removed.
         """
+        from astropy.table import Table as AstropyTable
+
         # Should never happen; adding a dataset should be the action that
         # causes a _Table to be created.
         if not self.dataIds:
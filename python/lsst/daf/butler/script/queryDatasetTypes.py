@@ -22,7 +22,6 @@ from __future__ import annotations
 
 from typing import Any, List
 
-from astropy.table import Table
 from numpy import array
 
 from .. import Butler
@@ -56,6 +55,8 @@ def queryDatasetTypes(repo, verbose, glob, components):
         A dict whose key is "datasetTypes" and whose value is a list of
         collection names.
     """
+    from astropy.table import Table
+
     butler = Butler(repo)
     datasetTypes = butler.registry.queryDatasetTypes(components=components, expression=globToRegex(glob))
     info: List[Any]
@@ -20,7 +20,6 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
 
-from astropy.table import Table as AstropyTable
 from collections import defaultdict, namedtuple
 from typing import Any, Dict
 import numpy as np
@@ -72,6 +71,8 @@ class _Table:
         table : `astropy.table._Table`
             The table with the provided column names and rows.
         """
+        from astropy.table import Table as AstropyTable
+
         def _id_type(datasetRef):
             if isinstance(datasetRef.id, uuid.UUID):
                 return str
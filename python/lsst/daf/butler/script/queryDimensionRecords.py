@@ -19,8 +19,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from astropy.table import Table
-
 from .. import Butler
 from ..core import Timespan
 from ..core.utils import globToRegex
@@ -30,6 +28,7 @@ def queryDimensionRecords(repo, element, datasets, collections, where, no_check)
     # Docstring for supported parameters is the same as
     # Registry.queryDimensionRecords except for ``no_check``, which is the
     # inverse of ``check``.
+    from astropy.table import Table
 
     collections = globToRegex(collections)
 
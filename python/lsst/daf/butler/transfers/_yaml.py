@@ -96,6 +96,29 @@ def _uuid_constructor(loader: yaml.Loader, node: yaml.Node) -> Optional[uuid.UUI
 yaml.Dumper.add_representer(uuid.UUID, _uuid_representer)
 yaml.SafeLoader.add_constructor("!uuid", _uuid_constructor)
 
+try:
+    _CSafeLoader = yaml.CSafeLoader
+except AttributeError:
+    # Not all installations have the C library
+    _Loader = yaml.SafeLoader
+else:
+    class _Loader(_CSafeLoader):  # type: ignore
+        """YAML loader using the C parser with the constructors registered
+        with `yaml.SafeLoader`.
+
+        The C parser is much faster for the large files written by
+        `YamlRepoExportBackend`, but constructors (for example for
+        `astropy.time.Time` or `lsst.sphgeom` regions) are registered with
+        `yaml.SafeLoader` by many packages and are not seen by
+        `yaml.CSafeLoader`.  Those registries are looked up when each
+        loader is created so that later registrations are honored too.
+        """
+
+        def __init__(self, stream: Any):
+            super().__init__(stream)
+            self.yaml_constructors = yaml.SafeLoader.yaml_constructors
+            self.yaml_multi_constructors = yaml.SafeLoader.yaml_multi_constructors
+
 
 class YamlRepoExportBackend(RepoExportBackend):
     """A repository export implementation that saves to a YAML file.
@@ -222,7 +245,7 @@ class YamlRepoImportBackend(RepoImportBackend):
         # instead of loading incrementally so we can spot some problems early;
         # because `register` can't be put inside a transaction, we'd rather not
         # run that at all if there's going to be problem later in `load`.
-        wrapper = yaml.safe_load(stream)
+        wrapper = yaml.load(stream, Loader=_Loader)
         if wrapper["version"] == 0:
             # Grandfather-in 'version: 0' -> 1.0.0, which is what we wrote
             # before we really tried to do versioning here.
@@ -24,9 +24,12 @@ import os
 import contextlib
 import collections
 import itertools
+import pickle
 from pathlib import Path
+from unittest.mock import patch
 
 from lsst.daf.butler import ConfigSubset, Config
+from lsst.daf.butler.core.config import _contentCache, _loadYaml
 from lsst.daf.butler.tests.utils import makeTestTempDir, removeTestTempDir
 
 TESTDIR = os.path.abspath(os.path.dirname(__file__))
@@ -682,6 +685,100 @@ class FileWriteConfigTestCase(unittest.TestCase):
             with self.assertRaises(FileExistsError):
                 c.dumpToUri(outpath, overwrite=False)
 
+    def testCachedRead(self):
+        """Test that repeated reads of a file see modifications to it and
+        to the files it includes."""
+        includePath = os.path.join(self.tmpdir, "include.yaml")
+        outpath = os.path.join(self.tmpdir, "test.yaml")
+        Config({"a": 1}).dumpToUri(includePath)
+        with open(outpath, "w") as fh:
+            print("inc: !include include.yaml", file=fh)
+            print("b: 2", file=fh)
+
+        c1 = Config(outpath)
+        self.assertEqual(c1, {"inc": {"a": 1}, "b": 2})
+
+        # Modifying the returned config must not affect later reads.
+        c1["inc", "a"] = 10
+        c2 = Config(outpath)
+        self.assertEqual(c2, {"inc": {"a": 1}, "b": 2})
+
+        # Changing an included file must be noticed.
+        Config({"a": 100}).dumpToUri(includePath)
+        c3 = Config(outpath)
+        self.assertEqual(c3, {"inc": {"a": 100}, "b": 2})
+
+        # As must changes to the file itself.
+        Config({"b": 30}).dumpToUri(outpath)
+        c4 = Config(outpath)
+        self.assertEqual(c4, {"b": 30})
+
+        # Even if it is rewritten at the same size and with the same
+        # modification time.
+        stat = os.stat(outpath)
+        Config({"b": 40}).dumpToUri(outpath)
+        os.utime(outpath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(os.stat(outpath).st_size, stat.st_size)
+        c5 = Config(outpath)
+        self.assertEqual(c5, {"b": 40})
+
+    def testDiskCache(self):
+        """Test that parsed content can be shared between processes."""
+        cacheDir = os.path.join(self.tmpdir, "cache")
+        outpath = os.path.join(self.tmpdir, "test.yaml")
+        Config({"a": 1}).dumpToUri(outpath)
+
+        with modified_environment(DAF_BUTLER_CONFIG_CACHE_DIR=cacheDir):
+            self.assertEqual(Config(outpath), {"a": 1})
+            entries = os.listdir(cacheDir)
+            self.assertEqual(len(entries), 1)
+
+            # Replace the entry with something recognizable and make sure
+            # it is used in place of parsing the file (the in-process cache
+            # has to be emptied to simulate a new process).
+            entry = os.path.join(cacheDir, entries[0])
+            with open(entry, "wb") as fh:
+                pickle.dump({"a": 2}, fh)
+            _contentCache.clear()
+            self.assertEqual(Config(outpath), {"a": 2})
+
+            # A corrupt entry is ignored.
+            with open(entry, "wb") as fh:
+                fh.write(b"not a pickle")
+            _contentCache.clear()
+            self.assertEqual(Config(outpath), {"a": 1})
+
+            # Modified content gets a new entry (use content of a different
+            # size so that the change is noticed regardless of the file
+            # system timestamp resolution).
+            Config({"a": 300}).dumpToUri(outpath)
+            self.assertEqual(Config(outpath), {"a": 300})
+            self.assertEqual(len(os.listdir(cacheDir)), 2)
+
+            # Files that include other files are not stored.
+            with open(outpath, "w") as fh:
+                print("inc: !include include.yaml", file=fh)
+            Config({"b": 4}).dumpToUri(os.path.join(self.tmpdir, "include.yaml"))
+            self.assertEqual(Config(outpath), {"inc": {"b": 4}})
+            self.assertEqual(len(os.listdir(cacheDir)), 2)
+
+    def testIdenticalContent(self):
+        """Test that identical files are only parsed once."""
+        paths = [os.path.join(self.tmpdir, f"{name}.yaml") for name in ("first", "second")]
+        for path in paths:
+            Config({"a": {"b": 1}}).dumpToUri(path)
+
+        _contentCache.clear()
+        with patch("lsst.daf.butler.core.config._loadYaml", wraps=_loadYaml) as mockLoad:
+            configs = [Config(path) for path in paths]
+        self.assertEqual(mockLoad.call_count, 1)
+        self.assertEqual(configs[0], configs[1])
+        self.assertEqual(configs[1].configFile.ospath, paths[1])
+
+        # Each Config must have its own copy of the content.
+        configs[0]["a", "b"] = 2
+        self.assertEqual(configs[1]["a", "b"], 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -98,6 +98,16 @@ class DimensionTestCase(unittest.TestCase):
             if isinstance(element, Dimension):
                 self.assertEqual(element.graph.required, element.required)
         self.assertEqual(DimensionGraph(self.universe, graph.required), graph)
+        # Graphs are cached, whether or not the given names need expansion.
+        self.assertIs(DimensionGraph(self.universe, graph.required), graph)
+        self.assertIs(DimensionGraph(self.universe, names=graph.names), graph)
+        self.assertIs(self.universe.extract(graph), graph)
+        self.assertIs(self.universe.extract(graph.required.names), graph)
+        if graph.implied:
+            # A graph built from incomplete names without conforming them
+            # must not be found by later lookups that do conform them.
+            DimensionGraph(self.universe, names=graph.required.names, conform=False)
+            self.assertIs(DimensionGraph(self.universe, names=graph.required.names), graph)
         self.assertCountEqual(graph.required,
                               [dimension for dimension in graph.dimensions
                                if not any(dimension in other.graph.implied for other in graph.elements)])
@@ -191,6 +201,27 @@ class DimensionTestCase(unittest.TestCase):
         self.assertCountEqual(graph.temporal.names,
                               ("observation_timespans",))
 
+    def testGraphComparisons(self):
+        """Test set-like comparison operations between graphs."""
+        a = DimensionGraph(self.universe, names=("visit",))
+        b = DimensionGraph(self.universe, names=("visit", "detector"))
+        c = DimensionGraph(self.universe, names=("patch",))
+        self.assertTrue(a.issubset(b))
+        self.assertFalse(b.issubset(a))
+        self.assertTrue(b.issuperset(a))
+        self.assertTrue(a < b)
+        self.assertTrue(b > a)
+        self.assertFalse(a < a)
+        self.assertTrue(a <= a)
+        self.assertTrue(a >= a)
+        self.assertFalse(a.isdisjoint(b))
+        self.assertTrue(a.isdisjoint(c))
+        self.assertTrue(self.universe.empty.isdisjoint(a))
+        self.assertTrue(self.universe.empty <= c)
+        self.assertEqual(a | c, DimensionGraph(self.universe, names=a.names | c.names))
+        self.assertEqual(a & b, a)
+        self.assertNotEqual(a, b)
+
     def testSchemaGeneration(self):
         tableSpecs = NamedKeyDict({})
         for element in self.universe.getStaticElements():
@@ -434,6 +465,19 @@ class DataCoordinateTestCase(unittest.TestCase):
                     self.assertEqual(list(dataId.values()), [dataId[d] for d in dataId.keys()])
                     self.assertEqual(list(dataId.values()), [dataId[d.name] for d in dataId.keys()])
                     self.assertEqual(dataId.keys(), dataId.graph.required)
+                    for d in dataId.keys():
+                        self.assertIn(d, dataId)
+                        self.assertIn(d.name, dataId)
+                        self.assertEqual(dataId.get(d), dataId[d])
+                        self.assertEqual(dataId.get(d.name), dataId[d])
+                    for d in dataId.graph.implied:
+                        self.assertEqual(d in dataId, dataId.hasFull())
+                        self.assertEqual(d.name in dataId, dataId.hasFull())
+                    self.assertNotIn("not_a_dimension", dataId)
+                    self.assertIsNone(dataId.get("not_a_dimension"))
+                    self.assertIsNone(dataId.get(5))
+                    with self.assertRaises(KeyError):
+                        dataId[5]
             for dataId in itertools.chain(split.complete, split.expanded):
                 with self.subTest(dataId=dataId):
                     self.assertTrue(dataId.hasFull())
@@ -466,6 +510,30 @@ class DataCoordinateTestCase(unittest.TestCase):
             self.assertNotEqual(a0.byName(), b1)
             self.assertNotEqual(a1, b0.byName())
             self.assertNotEqual(a1.byName(), b0)
+        # Mappings with keys that can't be standardized to the same dimensions
+        # compare unequal without raising.
+        for a0 in split.chain(0):
+            self.assertNotEqual(a0, dict(a0.byName(), not_a_dimension=1))
+            if a0.graph.required:
+                self.assertNotEqual(a0, {})
+
+    def testHashAndPickle(self):
+        """Test that equal `DataCoordinate` instances with different state
+        flags have the same hash, including after a pickle round trip.
+        """
+        dataIds = self.randomDataIds(n=2)
+        split = self.splitByStateFlags(dataIds)
+        for n in range(2):
+            for a, b in itertools.combinations(split.chain(n), 2):
+                self.assertEqual(hash(a), hash(b))
+            for dataId in split.chain(n):
+                with self.subTest(dataId=dataId):
+                    hash(dataId)
+                    dataId2 = pickle.loads(pickle.dumps(dataId))
+                    self.assertEqual(dataId2, dataId)
+                    self.assertEqual(hash(dataId2), hash(dataId))
+                    self.assertEqual(dataId2.hasFull(), dataId.hasFull())
+                    self.assertEqual(dataId2.hasRecords(), dataId.hasRecords())
 
     def testStandardize(self):
         """Test constructing a DataCoordinate from many different kinds of
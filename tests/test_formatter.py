@@ -25,6 +25,7 @@
 import inspect
 import os.path
 import unittest
+from unittest.mock import patch
 
 from lsst.daf.butler.tests import DatasetTestHelper
 from lsst.daf.butler import (Formatter, FormatterFactory, StorageClass, DatasetType, Config,
@@ -120,6 +121,11 @@ class FormatterFactoryTestCase(unittest.TestCase, DatasetTestHelper):
         from lsst.daf.butler.tests.deferredFormatter import DeferredFormatter
         self.assertEqual(type(f), DeferredFormatter)
 
+        # The class is only imported once for a given registry entry.
+        with patch("lsst.daf.butler.core.utils.doImport") as mockImport:
+            self.assertIs(self.factory.getFormatterClass(storageClassName), fcls)
+            mockImport.assert_not_called()
+
         with self.assertRaises(TypeError):
             # Requires a constructor parameter
             self.factory.getFormatter(storageClassName)
@@ -163,6 +169,9 @@ class FormatterFactoryTestCase(unittest.TestCase, DatasetTestHelper):
         from lsst.daf.butler.formatters.yaml import YamlFormatter
         self.assertEqual(type(f), YamlFormatter)
 
+        # Registering the same value again is allowed.
+        self.factory.registerFormatter(storageClassName, formatterTypeName)
+
         with self.assertRaises(KeyError):
             # Attempt to overwrite using a different value
             self.factory.registerFormatter(storageClassName,
@@ -152,6 +152,29 @@ class FileURITestCase(unittest.TestCase):
         self.assertEqual(uri.path, "${MY_TEST_DIR}/d.txt")
         self.assertFalse(uri.scheme)
 
+    def testRelativeRoot(self):
+        """Test that a relative string root is used as given."""
+        uri = ButlerURI("c/d.txt", root="a/b", forceAbsolute=True)
+        self.assertFalse(uri.scheme)
+        self.assertEqual(uri.path, "a/b/c/d.txt")
+
+    def testSchemeSeparatorInPath(self):
+        """Test that local paths containing "://" are not treated as remote
+        URIs."""
+        for path in ("/tmp/a://b", "./a://b"):
+            uri = ButlerURI(path)
+            self.assertEqual(uri.scheme, "file", f"Checking {path}")
+            self.assertTrue(os.path.isabs(uri.ospath), f"Checking {path}")
+
+    def testUpperCaseFileScheme(self):
+        """Test that directory detection is not cached for file URIs
+        regardless of the case of the scheme."""
+        dirpath = os.path.join(self.tmpdir, "ucdir")
+        uri_str = f"FILE://{dirpath}"
+        self.assertFalse(ButlerURI(uri_str).dirLike)
+        os.mkdir(dirpath)
+        self.assertTrue(ButlerURI(uri_str).dirLike)
+
     def testMkdir(self):
         tmpdir = ButlerURI(self.tmpdir)
         newdir = tmpdir.join("newdir/seconddir")
@@ -154,6 +154,19 @@ class NamedKeyDictTest(unittest.TestCase):
         self.assertEqual(nkd, self.dictionary)
         self.assertEqual(self.dictionary, nkd)
 
+    def testFreeze(self):
+        nkd = NamedKeyDict(self.dictionary).freeze()
+        self.check(nkd)
+        self.assertEqual(nkd["a"], 10)
+        with self.assertRaises(TypeError):
+            nkd["a"] = 30
+        with self.assertRaises(TypeError):
+            del nkd[self.b]
+        copy = nkd.copy()
+        copy["a"] = 30
+        self.assertEqual(copy["a"], 30)
+        self.assertEqual(nkd["a"], 10)
+
 
 class NamedValueSetTest(unittest.TestCase):
 
@@ -189,6 +202,14 @@ class NamedValueSetTest(unittest.TestCase):
         nvs = NamedValueSet(s)
         self.assertEqual(nvs, s)
         self.assertEqual(s, nvs)
+        self.assertEqual(nvs, nvs)
+        self.assertEqual(nvs, NamedValueSet(s))
+        ab = NamedValueSet({self.a, self.b})
+        self.assertNotEqual(nvs, ab)
+        self.assertLessEqual(ab, nvs)
+        self.assertGreaterEqual(nvs, ab)
+        self.assertFalse(nvs <= ab)
+        self.assertFalse(ab >= nvs)
 
     def checkOperator(self, result, expected):
         self.assertIsInstance(result, NamedValueSet)
@@ -202,6 +223,23 @@ class NamedValueSetTest(unittest.TestCase):
         self.checkOperator(ab ^ bc, {self.a, self.c})
         self.checkOperator(ab - bc, {self.a})
 
+    def testFreeze(self):
+        nvs = NamedValueSet({self.a, self.b}).freeze()
+        self.assertEqual(nvs["a"], self.a)
+        self.assertIn(self.b, nvs)
+        with self.assertRaises(TypeError):
+            nvs.add(self.c)
+        with self.assertRaises(TypeError):
+            nvs.remove(self.a)
+        with self.assertRaises(TypeError):
+            nvs.pop()
+        with self.assertRaises(TypeError):
+            nvs.asMapping()["c"] = self.c
+        self.assertEqual(nvs, {self.a, self.b})
+        copy = nvs.copy()
+        copy.add(self.c)
+        self.assertEqual(copy, {self.a, self.b, self.c})
+
 
 class TestButlerUtils(unittest.TestCase):
     """Tests of the simple utilities."""